@@ -9,7 +9,6 @@ import hashlib
 
 from app.services.google_drive_service import drive_service
 from app.services.document_service import document_processor
-from app.services.vector_service import vector_service
 
 router = APIRouter()
 
@@ -33,6 +32,8 @@ async def sync_drive_folder(request: DriveFolderRequest):
     Request body:
     - folder_url_or_id: Google Drive folder URL or ID
     """
+    from app.services.vector_service import vector_service
+    
     try:
         # Extract folder ID
         folder_id = drive_service.get_folder_id_from_url(request.folder_url_or_id)
@@ -63,7 +64,8 @@ async def sync_drive_folder(request: DriveFolderRequest):
                 
                 # Store in vector database
                 doc_id = hashlib.md5(file['id'].encode()).hexdigest()
-                vector_service.store_chunks(doc_info['chunks'], doc_id)
+                # wait=True: only report the file as synced once its points are indexed
+                await vector_service.store_chunks_async(doc_info['chunks'], doc_id, wait=True)
                 
                 synced.append({
                     'id': doc_id,
@@ -106,6 +108,8 @@ async def list_documents():
 @router.delete("/{doc_id}")
 async def delete_document(doc_id: str):
     """Remove document from vector database"""
+    from app.services.vector_service import vector_service
+    
     try:
         vector_service.delete_document(doc_id)
         return {"message": f"Document {doc_id} deleted", "status": "success"}
@@ -3,6 +3,7 @@ Social Media API Endpoints
 Exposes YouTube, Telegram, Mastodon services
 """
 from fastapi import APIRouter, Query
+from fastapi.responses import ORJSONResponse
 from typing import Optional
 
 from app.services.social_media.youtube_service import YouTubeService
@@ -11,14 +12,15 @@ from app.services.social_media.social_aggregator import social_aggregator
 router = APIRouter()
 
 
-@router.get("/kenya/pulse")
+@router.get("/kenya/pulse", response_class=ORJSONResponse)
 async def get_kenya_social_pulse(
     keywords: Optional[str] = Query(None)
 ):
     """Get overall Kenya social media sentiment pulse"""
     keyword_list = keywords.split(',') if keywords else ['Kenya']
     result = social_aggregator.fetch_kenya_social(keywords=keyword_list)
-    return result
+    # Serialize directly with orjson - the payload is plain dicts/lists
+    return ORJSONResponse(content=result)
 
 
 @router.get("/mastodon/search")
@@ -29,6 +29,8 @@ class Settings(BaseSettings):
     
     # AI/ML
     EMBEDDING_MODEL: str = "sentence-transformers/all-MiniLM-L6-v2"
+    EMBEDDING_BACKEND: str = "onnx"  # "onnx" (ONNX Runtime) or "torch"
+    EMBEDDING_ONNX_FILE: str = "onnx/model_qint8_avx512_vnni.onnx"
     LLM_MODEL: str = "llama3-70b-8192"
     LLM_TEMPERATURE: float = 0.1
     MAX_TOKENS: int = 8192
@@ -50,8 +52,13 @@ class Settings(BaseSettings):
     GDELT_ENABLED: bool = True
     GDELT_LOOKBACK_DAYS: int = 1000
     
+    # YouTube
+    YOUTUBE_DISCOVERY_DOC: str = ""  # Optional path to a pre-fetched youtube v3 discovery JSON
+    YOUTUBE_CACHE_DIR: str = "/tmp/govgpt_yt"
+    
     # Sentiment
     SENTIMENT_BATCH_SIZE: int = 32
+    SENTIMENT_WARMUP: bool = True
     
     # Rate Limiting
     RATE_LIMIT_REQUESTS: int = 100
@@ -9,8 +9,10 @@ from fastapi.responses import JSONResponse
 import structlog
 
 from app.config import settings
+from app.utils.logging_setup import setup_logging, shutdown_logging
 
 # Configure logging
+setup_logging(settings.LOG_LEVEL)
 logger = structlog.get_logger()
 
 # Create FastAPI app
@@ -46,6 +48,9 @@ async def startup_event():
 async def shutdown_event():
     """Cleanup on shutdown"""
     logger.info("Shutting down GovGPT API")
+    from app.services.vector_service import vector_service
+    await vector_service.close_async_client()
+    shutdown_logging()
     # TODO: Close connections
 
 
@@ -119,11 +124,19 @@ async def startup_event():
         try:
             from app.services.social_media.youtube_service import youtube_service
             youtube_service.api_key = settings.YOUTUBE_API_KEY
-            from googleapiclient.discovery import build
-            youtube_service.youtube = build('youtube', 'v3', developerKey=settings.YOUTUBE_API_KEY)
+            youtube_service._initialize()
             logger.info("✅ YouTube service initialized with API key")
         except Exception as e:
             logger.error(f"⚠️  YouTube service not initialized: {e}")
+    
+    # Warm up sentiment analyzer so the first request in each worker doesn't pay for corpus load
+    if settings.SENTIMENT_WARMUP:
+        try:
+            from app.services.social_media.sentiment_service import sentiment_analyzer
+            sentiment_analyzer.warmup()
+            logger.info("✅ Sentiment analyzer warmed up")
+        except Exception as e:
+            logger.error(f"⚠️  Sentiment analyzer warmup failed: {e}")
 
 
 # Import API routers
@@ -3,14 +3,18 @@ Chat Service
 Orchestrates RAG, news, sentiment, and LLM for chat responses
 """
 from typing import Dict, List, Iterator
-from app.services.vector_service import vector_service
-from app.services.llm_service import llm_service
 from app.services.news.gdelt_service import gdelt_service
 from app.services.social_media.social_aggregator import social_aggregator
 from app.services.social_media.youtube_comment_sentiment import youtube_comment_sentiment
 from app.utils.query_classifier import classify_query, get_query_confidence
 import json
 
+# Common words dropped from questions before keyword search (built once)
+STOPWORDS = frozenset({
+    'what', 'is', 'the', 'a', 'an', 'on', 'in', 'of', 'for', 'to',
+    'about', 'how', 'why', 'when', 'where', 'which'
+})
+
 
 class ChatService:
     """Main chat orchestration service"""
@@ -20,10 +24,9 @@ class ChatService:
     
     def _extract_keywords(self, question: str) -> list:
         """Extract key topics from question for targeted search"""
-        # Remove common words
-        stopwords = {'what', 'is', 'the', 'a', 'an', 'on', 'in', 'of', 'for', 'to', 'about', 'how', 'why', 'when', 'where', 'which'}
+        # Remove common words (words are already lowercase)
         words = question.lower().split()
-        keywords = [w.strip('?,!.') for w in words if w.lower() not in stopwords and len(w) > 3]
+        keywords = [w.strip('?,!.') for w in words if w not in STOPWORDS and len(w) > 3]
         
         # Always include "Kenya" to keep context
         if 'kenya' not in keywords:
@@ -57,6 +60,7 @@ class ChatService:
         
         # 1. Get relevant document chunks (RAG)
         try:
+            from app.services.vector_service import vector_service
             if vector_service.client:
                 chunks = vector_service.search_similar(question, limit=5)
                 context['document_chunks'] = chunks
@@ -131,6 +135,8 @@ class ChatService:
         Returns:
             Response with answer and sources
         """
+        from app.services.llm_service import llm_service
+        
         # Gather context
         context = self.get_context(message)
         
@@ -183,6 +189,8 @@ class ChatService:
         Yields:
             Response chunks and metadata
         """
+        from app.services.llm_service import llm_service
+        
         # Auto-detect query type
         query_classification = get_query_confidence(message)
         query_type = query_classification['type']
@@ -313,6 +321,7 @@ class ChatService:
             Structured decision report with all sections
         """
         from datetime import datetime
+        from app.services.llm_service import llm_service
         
         # Gather full context
         context = self.get_context(question)
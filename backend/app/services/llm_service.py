@@ -444,5 +444,15 @@ class LLMService:
         prompt += "\n\nBased on this context, generate a complete structured decision report in the specified JSON format."
         return prompt
 
-# Initialize service instance
-llm_service = LLMService(api_key=settings.GROQ_API_KEY)
+# Service instance, created on first access so importing this module doesn't build a Groq client
+_llm_service: Optional[LLMService] = None
+
+
+def __getattr__(name: str):
+    """Lazily create the llm_service singleton (PEP 562 module attribute hook)"""
+    global _llm_service
+    if name == "llm_service":
+        if _llm_service is None:
+            _llm_service = LLMService(api_key=settings.GROQ_API_KEY)
+        return _llm_service
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
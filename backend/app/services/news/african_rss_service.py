@@ -2,8 +2,9 @@
 Pan-African RSS Feed Parser
 Covers news outlets across all 54 African countries
 """
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 import feedparser
 import requests
 from time import mktime
@@ -80,18 +81,20 @@ class AfricanRSSService:
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
         })
     
+    # Feeds fetched concurrently; each fetch is network-bound
+    MAX_FETCH_WORKERS = 16
+    
     def fetch_all_feeds(self, max_per_feed: int = 10) -> List[Dict]:
         """Fetch articles from ALL African RSS feeds"""
-        all_articles = []
+        results = self._fetch_feeds_concurrently(list(self.AFRICAN_FEEDS), max_per_feed)
         
-        for source_name, feed_url in self.AFRICAN_FEEDS.items():
-            try:
-                articles = self.fetch_feed(feed_url, source_name, max_per_feed)
-                all_articles.extend(articles)
-                print(f"✅ {source_name}: {len(articles)} articles")
-            except Exception as e:
-                print(f"❌ {source_name}: {e}")
+        all_articles = []
+        for source_name, articles, error in results:
+            if error:
+                print(f"❌ {source_name}: {error}")
                 continue
+            all_articles.extend(articles)
+            print(f"✅ {source_name}: {len(articles)} articles")
         
         return all_articles
     
@@ -100,17 +103,48 @@ class AfricanRSSService:
         if region not in self.REGIONAL_MAPPING:
             return []
         
+        results = self._fetch_feeds_concurrently(self.REGIONAL_MAPPING[region], max_per_feed)
+        
         all_articles = []
-        for source_name in self.REGIONAL_MAPPING[region]:
-            try:
-                feed_url = self.AFRICAN_FEEDS[source_name]
-                articles = self.fetch_feed(feed_url, source_name, max_per_feed)
+        for _, articles, error in results:
+            if not error:
                 all_articles.extend(articles)
-            except:
-                continue
         
         return all_articles
     
+    def _fetch_feeds_concurrently(
+        self,
+        source_names: List[str],
+        max_per_feed: int
+    ) -> List[Tuple[str, List[Dict], Optional[Exception]]]:
+        """
+        Fetch several feeds on a thread pool so wall time is the slowest feed, not the sum
+        
+        Parsing stays on these threads. A process pool for feedparser would fork
+        workers from every threaded server process and re-import unguarded
+        scripts under spawn, for a parse step that is small next to the fetch.
+        
+        Args:
+            source_names: Keys into AFRICAN_FEEDS
+            max_per_feed: Maximum articles per feed
+            
+        Returns:
+            (source_name, articles, error) per feed, in the order given
+        """
+        def fetch(source_name: str):
+            try:
+                feed_url = self.AFRICAN_FEEDS[source_name]
+                return source_name, self.fetch_feed(feed_url, source_name, max_per_feed), None
+            except Exception as e:
+                return source_name, [], e
+        
+        if not source_names:
+            return []
+        
+        workers = min(self.MAX_FETCH_WORKERS, len(source_names))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(fetch, source_names))
+    
     def fetch_feed(self, feed_url: str, source_name: str, max_articles: int = 10) -> List[Dict]:
         """Fetch and parse a single RSS feed"""
         try:
@@ -4,8 +4,12 @@ Fetches posts from Mastodon instances with Kenya content
 """
 from datetime import datetime
 from typing import List, Dict, Optional
+import re
 import requests
 
+# Compiled once; applied to every status in every timeline
+HTML_TAG_RE = re.compile(r'<[^>]+>')
+
 
 class MastodonService:
     """Service for fetching Kenya discussions from Mastodon/Fediverse"""
@@ -128,8 +132,7 @@ class MastodonService:
     def _standardize_post(self, item: Dict) -> Dict:
         """Convert Mastodon status to standardized format"""
         # Strip HTML from content
-        import re
-        content = re.sub(r'<[^>]+>', '', item.get('content', ''))
+        content = HTML_TAG_RE.sub('', item.get('content', ''))
         
         account = item.get('account', {})
         
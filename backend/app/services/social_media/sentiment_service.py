@@ -2,21 +2,72 @@
 Sentiment Analysis Service using TextBlob
 Fast, lightweight sentiment analysis for social media
 """
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict, List, Tuple
+import threading
+
+# TextBlob's pattern lexicon scorer is imported on first use and shared by
+# every analyzer in the process
+_scorer = None
+_scorer_lock = threading.Lock()
+
+
+def _load_scorer():
+    """
+    Import TextBlob's lexicon scorer once and page its lexicon in before the first real call
+
+    This is the same scorer TextBlob(text).sentiment ends up calling, minus the
+    per-call TextBlob construction and the namedtuple class PatternAnalyzer
+    builds on every analyze().
+    """
+    global _scorer
+    if _scorer is None:
+        with _scorer_lock:
+            if _scorer is None:
+                from textblob.en import sentiment as pattern_sentiment
+                pattern_sentiment("warmup")
+                _scorer = pattern_sentiment
+    return _scorer
+
+
+_RESULT_KEYS = ('sentiment', 'score', 'confidence', 'polarity', 'subjectivity')
+
+
+@lru_cache(maxsize=8192)
+def _analyze_cached(text: str) -> Tuple:
+    """Score text with TextBlob's lexicon; cached because duplicate comments are common"""
+    polarity, subjectivity = _load_scorer()(text)
+    
+    if polarity > 0.1:
+        sentiment = 'positive'
+    elif polarity < -0.1:
+        sentiment = 'negative'
+    else:
+        sentiment = 'neutral'
+    
+    abs_polarity = abs(polarity)
+    if abs_polarity > 0.5:
+        confidence = 'high'
+    elif abs_polarity > 0.2:
+        confidence = 'medium'
+    else:
+        confidence = 'low'
+    
+    return (
+        sentiment,
+        round(abs_polarity, 3),
+        confidence,
+        round(polarity, 3),
+        round(subjectivity, 3)
+    )
 
 
 class SentimentAnalyzer:
     """Lightweight sentiment analysis using TextBlob - lazy loaded"""
     
-    def __init__(self):
-        self._blob = None
-    
-    @property
-    def TextBlob(self):
-        if self._blob is None:
-            from textblob import TextBlob
-            self._blob = TextBlob
-        return self._blob
+    def warmup(self):
+        """Load the TextBlob lexicon ahead of the first request (call once per worker)"""
+        _load_scorer()
     
     def analyze(self, text: str) -> Dict:
         """Analyze sentiment of text"""
@@ -30,32 +81,7 @@ class SentimentAnalyzer:
             }
         
         try:
-            blob = self.TextBlob(text)
-            polarity = blob.sentiment.polarity
-            subjectivity = blob.sentiment.subjectivity
-            
-            if polarity > 0.1:
-                sentiment = 'positive'
-            elif polarity < -0.1:
-                sentiment = 'negative'
-            else:
-                sentiment = 'neutral'
-            
-            abs_polarity = abs(polarity)
-            if abs_polarity > 0.5:
-                confidence = 'high'
-            elif abs_polarity > 0.2:
-                confidence = 'medium'
-            else:
-                confidence = 'low'
-            
-            return {
-                'sentiment': sentiment,
-                'score': round(abs_polarity, 3),
-                'confidence': confidence,
-                'polarity': round(polarity, 3),
-                'subjectivity': round(subjectivity, 3)
-            }
+            return dict(zip(_RESULT_KEYS, _analyze_cached(text)))
         except Exception as e:
             return {
                 'sentiment': 'neutral',
@@ -65,6 +91,10 @@ class SentimentAnalyzer:
                 'subjectivity': 0.0
             }
     
+    def cache_info(self) -> Dict:
+        """Hit/miss statistics for the duplicate-text cache"""
+        return _analyze_cached.cache_info()._asdict()
+    
     def analyze_batch(self, texts: List[str]) -> List[Dict]:
         return [self.analyze(text) for text in texts]
 
@@ -2,6 +2,7 @@
 Unified Social Media Aggregator
 Combines all social media sources with sentiment analysis
 """
+from collections import Counter
 from typing import List, Dict, Optional
 from app.services.social_media.telegram_service import telegram_service
 from app.services.social_media.mastodon_service import mastodon_service
@@ -36,10 +37,8 @@ class SocialAggregator:
         # Fetch from Telegram
         try:
             telegram_posts = self.telegram.fetch_all_kenya_channels(limit_per_channel=5)
-            for post in telegram_posts:
-                if include_sentiment:
-                    post['sentiment'] = self.sentiment.analyze(post['content'])
-                all_posts.append(post)
+            self._annotate_sentiment(telegram_posts, include_sentiment)
+            all_posts.extend(telegram_posts)
         except Exception as e:
             print(f"Telegram error: {e}")
         
@@ -47,41 +46,47 @@ class SocialAggregator:
         try:
             query = keywords[0] if keywords else "Kenya"
             mastodon_posts = self.mastodon.search_kenya_posts(query=query, limit=20)
-            for post in mastodon_posts:
-                if include_sentiment:
-                    post['sentiment'] = self.sentiment.analyze(post['content'])
-                all_posts.append(post)
+            self._annotate_sentiment(mastodon_posts, include_sentiment)
+            all_posts.extend(mastodon_posts)
         except Exception as e:
             print(f"Mastodon error: {e}")
         
         # Calculate overall sentiment
         sentiment_summary = self._calculate_sentiment_summary(all_posts)
+        platform_counts = Counter(post.get('platform') for post in all_posts)
         
         return {
             'posts': all_posts,
             'total_count': len(all_posts),
             'sentiment_summary': sentiment_summary,
             'platforms': {
-                'telegram': len([p for p in all_posts if p.get('platform') == 'telegram']),
-                'mastodon': len([p for p in all_posts if p.get('platform') == 'mastodon']),
-                'youtube': len([p for p in all_posts if p.get('platform') == 'youtube']),
+                'telegram': platform_counts['telegram'],
+                'mastodon': platform_counts['mastodon'],
+                'youtube': platform_counts['youtube'],
             }
         }
     
+    def _annotate_sentiment(self, posts: List[Dict], include_sentiment: bool):
+        """Attach sentiment to each post using one batch call"""
+        if not include_sentiment or not posts:
+            return
+        
+        sentiments = self.sentiment.analyze_batch([post['content'] for post in posts])
+        for post, sentiment in zip(posts, sentiments):
+            post['sentiment'] = sentiment
+    
     def _calculate_sentiment_summary(self, posts: List[Dict]) -> Dict:
         """Calculate sentiment distribution across posts"""
-        sentiments = []
-        for post in posts:
-            if 'sentiment' in post:
-                sentiments.append(post['sentiment']['sentiment'])
+        # One pass over the posts instead of a .count() scan per label
+        counts = Counter(post['sentiment']['sentiment'] for post in posts if 'sentiment' in post)
         
-        if not sentiments:
+        total = sum(counts.values())
+        if not total:
             return {'positive': 0, 'negative': 0, 'neutral': 0, 'overall': 'unknown'}
         
-        total = len(sentiments)
-        positive = sentiments.count('positive')
-        negative = sentiments.count('negative')
-        neutral = sentiments.count('neutral')
+        positive = counts['positive']
+        negative = counts['negative']
+        neutral = counts['neutral']
         
         # Determine overall mood
         if positive > negative:
@@ -4,6 +4,8 @@ Fetches messages from public Kenya news and politics channels
 """
 from datetime import datetime
 from typing import List, Dict, Optional
+import io
+import ahocorasick
 import requests
 
 
@@ -74,44 +76,80 @@ class TelegramService:
             return []
     
     def _parse_telegram_web(self, html: str, channel_name: str, limit: int) -> List[Dict]:
-        """Parse Telegram web preview for messages"""
-        from bs4 import BeautifulSoup
+        """Parse Telegram web preview for messages, stopping after `limit` bubbles"""
+        from lxml import etree
         
-        soup = BeautifulSoup(html, 'html.parser')
         messages = []
+        if limit <= 0:
+            return messages
         
-        # Find message bubbles
-        message_divs = soup.find_all('div', class_='tgme_widget_message_bubble')
-        
-        for div in message_divs[:limit]:
+        # Stream-parse the page so nothing past the last wanted bubble is parsed
+        bubbles = 0
+        for _, div in etree.iterparse(
+            io.BytesIO(html.encode('utf-8')), events=('end',), tag='div', html=True,
+            encoding='utf-8'
+        ):
+            if not self._has_class(div, 'tgme_widget_message_bubble'):
+                continue
+            
             try:
                 # Extract text
-                text_div = div.find('div', class_='tgme_widget_message_text')
-                text = text_div.get_text(strip=True) if text_div else ''
+                text_div = self._find_by_class(div, 'div', 'tgme_widget_message_text')
+                text = self._get_text(text_div, max_length=500) if text_div is not None else ''
                 
                 # Extract date
-                date_div = div.find('time', class_='datetime')
-                date_str = date_div.get('datetime', '') if date_div else ''
+                date_el = self._find_by_class(div, 'time', 'datetime')
+                date_str = date_el.get('datetime', '') if date_el is not None else ''
                 
                 # Extract views
-                views_span = div.find('span', class_='tgme_widget_message_views')
-                views = views_span.get_text(strip=True) if views_span else '0'
+                views_span = self._find_by_class(div, 'span', 'tgme_widget_message_views')
+                views = self._get_text(views_span) if views_span is not None else '0'
                 
                 if text:
                     messages.append({
                         'platform': 'telegram',
                         'channel': channel_name,
-                        'content': text[:500],
+                        'content': text,
                         'published_at': date_str,
                         'views': self._parse_views(views),
                         'url': f"https://t.me/{channel_name}"
                     })
                     
             except Exception:
-                continue
+                pass
+            
+            bubbles += 1
+            if bubbles >= limit:
+                break
         
         return messages
     
+    @staticmethod
+    def _has_class(element, class_name: str) -> bool:
+        """Check whether an element carries the given CSS class"""
+        return class_name in (element.get('class') or '').split()
+    
+    def _find_by_class(self, element, tag: str, class_name: str):
+        """Return the first descendant `tag` element with the given CSS class"""
+        for child in element.iter(tag):
+            if self._has_class(child, class_name):
+                return child
+        return None
+    
+    @staticmethod
+    def _get_text(element, max_length: Optional[int] = None) -> str:
+        """Concatenate the stripped text nodes of an element, up to max_length chars"""
+        pieces = []
+        length = 0
+        for piece in element.itertext():
+            piece = piece.strip()
+            pieces.append(piece)
+            length += len(piece)
+            if max_length is not None and length >= max_length:
+                break
+        text = ''.join(pieces)
+        return text if max_length is None else text[:max_length]
+    
     def _parse_views(self, views_str: str) -> int:
         """Parse view count string (e.g., '1.2K' -> 1200)"""
         try:
@@ -143,11 +181,18 @@ class TelegramService:
         """Search Kenya channels for specific topics"""
         all_messages = self.fetch_all_kenya_channels(limit_per_channel=20)
         
+        # Build one automaton so each message is scanned once for all keywords
+        automaton = ahocorasick.Automaton()
+        for kw in keywords:
+            automaton.add_word(kw.lower(), kw)
+        if len(automaton) == 0:
+            return []
+        automaton.make_automaton()
+        
         # Filter by keywords
         matching = []
         for msg in all_messages:
-            text = msg['content'].lower()
-            if any(kw.lower() in text for kw in keywords):
+            if next(automaton.iter(msg['content'].lower()), None):
                 matching.append(msg)
         
         return matching[:limit]
@@ -2,8 +2,9 @@
 YouTube Comment Sentiment Service
 Fetches and analyzes comments from Kenya news videos
 """
+from operator import itemgetter
 from typing import List, Dict
-from app.services.social_media.youtube_service import youtube_service
+import heapq
 from app.services.social_media.sentiment_service import sentiment_analyzer
 
 
@@ -11,7 +12,19 @@ class YouTubeCommentSentiment:
     """Fetch YouTube comments and analyze sentiment from Kenya news channels"""
     
     def __init__(self):
-        self.youtube = youtube_service
+        self._youtube = None
+    
+    @property
+    def youtube(self):
+        """YouTube service, resolved on first use so importing this module builds nothing"""
+        if self._youtube is None:
+            from app.services.social_media.youtube_service import youtube_service
+            self._youtube = youtube_service
+        return self._youtube
+    
+    @youtube.setter
+    def youtube(self, service):
+        self._youtube = service
     
     def get_sentiment_from_videos(
         self,
@@ -31,7 +44,7 @@ class YouTubeCommentSentiment:
             Dictionary with sentiment analysis and sample comments
         """
         # Search for Kenya-related videos
-        videos = self.youtube.search_videos(query, max_results=max_videos)
+        videos = self.youtube.search_kenya_videos(query, max_results=max_videos)
         
         if not videos:
             return {
@@ -51,35 +64,35 @@ class YouTubeCommentSentiment:
         
         print(f"💬 Fetching comments from {len(videos)} Kenya videos...")
         
-        for video in videos:
-            video_id = video['id']
-            comments = self.youtube.get_video_comments(video_id, max_results=comments_per_video)
-            
-            # Analyze sentiment for each comment
+        # Fetch comments for all videos concurrently
+        video_comments = self.youtube.get_comments_for_videos(
+            [video['video_id'] for video in videos],
+            max_per_video=comments_per_video
+        )
+        
+        # Keep comments long enough to carry sentiment
+        for video, comments in zip(videos, video_comments):
             for comment in comments:
-                text = comment.get('text', '')
-                if not text or len(text.strip()) < 10:
-                    continue
-                
-                # Get sentiment
-                sentiment = sentiment_analyzer.analyze(text)
-                
-                comment['sentiment'] = sentiment['sentiment']
-                comment['sentiment_score'] = sentiment['score']
-                comment['polarity'] = sentiment['polarity']
-                comment['video_title'] = video['title']
-                
-                # Track counts
-                sentiment_counts[sentiment['sentiment']] += 1
-                total_score += sentiment['score']
-                
-                all_comments.append(comment)
+                text = comment.get('content', '')
+                if text and len(text.strip()) >= 10:
+                    comment['video_title'] = video['title']
+                    all_comments.append(comment)
+        
+        # Score all comments in one batch, tallying counts in the same pass
+        sentiments = sentiment_analyzer.analyze_batch([c['content'] for c in all_comments])
+        for comment, sentiment in zip(all_comments, sentiments):
+            comment['sentiment'] = sentiment['sentiment']
+            comment['sentiment_score'] = sentiment['score']
+            comment['polarity'] = sentiment['polarity']
+            
+            sentiment_counts[sentiment['sentiment']] += 1
+            total_score += sentiment['score']
         
         # Calculate average
         avg_score = total_score / len(all_comments) if all_comments else 0.0
         
-        # Sort by sentiment score (most polarized first)
-        all_comments.sort(key=lambda x: abs(x.get('polarity', 0)), reverse=True)
+        # Top 10 most polarized (sentiment_score is already |polarity|)
+        sample_comments = heapq.nlargest(10, all_comments, key=itemgetter('sentiment_score'))
         
         print(f"💬 Analyzed {len(all_comments)} YouTube comments")
         print(f"   Positive: {sentiment_counts['positive']}, Negative: {sentiment_counts['negative']}, Neutral: {sentiment_counts['neutral']}")
@@ -88,7 +101,7 @@ class YouTubeCommentSentiment:
             'total_comments': len(all_comments),
             'sentiment_summary': sentiment_counts,
             'average_score': round(avg_score, 3),
-            'sample_comments': all_comments[:10],  # Top 10 most polarized
+            'sample_comments': sample_comments,
             'videos_analyzed': len(videos)
         }
     
@@ -127,7 +140,7 @@ class YouTubeCommentSentiment:
         
         for i, comment in enumerate(sentiment_data['sample_comments'][:5], 1):
             sentiment_emoji = "😊" if comment['sentiment'] == 'positive' else "😟" if comment['sentiment'] == 'negative' else "😐"
-            context += f"\n{i}. {sentiment_emoji} \"{comment['text'][:150]}...\""
+            context += f"\n{i}. {sentiment_emoji} \"{comment['content'][:150]}...\""
             context += f"\n   (From: {comment['video_title'][:60]}...)"
         
         return context
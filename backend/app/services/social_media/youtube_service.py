@@ -2,16 +2,165 @@
 YouTube Service for Kenya News Channel Comments
 Fetches comments from Citizen TV, KTN, NTV and other Kenya news channels
 """
-from datetime import datetime
-from typing import List, Dict, Optional
-from googleapiclient.discovery import build
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, Iterator, List, Mapping, Optional, Tuple
+from urllib.parse import urlencode
+from zoneinfo import ZoneInfo
+import asyncio
+import hashlib
+import json
+import logging
+import socket
+import ssl
+import diskcache
+import httpx
+import orjson
+from tenacity import (
+    RetryCallState,
+    retry,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential_jitter
+)
+from app.config import settings
+from app.utils.async_runner import run_sync
+
+logger = logging.getLogger(__name__)
+
+# googleapiclient/httplib2 are imported when a client is built; the async REST path never needs them
+if TYPE_CHECKING:
+    from googleapiclient.discovery import Resource
+
+YOUTUBE_API_URL = "https://www.googleapis.com/youtube/v3"
+
+# Partial responses: only the paths _standardize_video/_standardize_comment read
+SEARCH_FIELDS = (
+    'items(id/videoId,'
+    'snippet(title,description,channelTitle,channelId,publishedAt,thumbnails/medium/url))'
+)
+COMMENT_FIELDS = (
+    'items(id,snippet(totalReplyCount,'
+    'topLevelComment/snippet(videoId,authorDisplayName,textDisplay,likeCount,publishedAt)))'
+)
+
+
+@lru_cache(maxsize=1)
+def _discovery_document() -> Optional[Dict]:
+    """
+    Parsed YouTube v3 discovery document, loaded once per process
+    
+    Reads YOUTUBE_DISCOVERY_DOC if set (fetched at deploy time), otherwise
+    the copy bundled with google-api-python-client. build_from_document only
+    adds derived keys idempotently, so the parsed dict is safe to share.
+    """
+    from googleapiclient.discovery_cache import get_static_doc
+    
+    if settings.YOUTUBE_DISCOVERY_DOC:
+        with open(settings.YOUTUBE_DISCOVERY_DOC) as f:
+            return json.load(f)
+    
+    document = get_static_doc('youtube', 'v3')
+    return json.loads(document) if document else None
+
+
+@lru_cache(maxsize=1)
+def _response_cache() -> diskcache.Cache:
+    """On-disk cache of raw API responses, shared by every service instance"""
+    cache = diskcache.Cache(settings.YOUTUBE_CACHE_DIR)
+    cache.create_tag_index()
+    return cache
+
+
+def _request_key(endpoint: str, params: Dict) -> str:
+    """Cache key for an API request (the API key is never part of it)"""
+    url = f"{YOUTUBE_API_URL}/{endpoint}?{urlencode(sorted(params.items()))}"
+    return hashlib.blake2b(url.encode(), digest_size=16).hexdigest()
+
+
+# Empty results are cached briefly so back-to-back retries don't re-spend quota
+EMPTY_RESULT_TTL = 120
+
+# Sentinel key set while the daily API quota is exhausted
+QUOTA_EXCEEDED_KEY = 'quota_exceeded'
+
+# Daily quota resets at midnight Pacific time
+QUOTA_RESET_TZ = 'America/Los_Angeles'
+
+
+class QuotaExceededError(Exception):
+    """The daily YouTube Data API quota is exhausted (served from the negative cache)"""
+
+
+def _response_ttl(response: Dict, ttl: int) -> int:
+    """Cache lifetime for a response: short for empty results, ttl otherwise"""
+    return ttl if response.get('items') else min(ttl, EMPTY_RESULT_TTL)
+
+
+def _seconds_until_quota_reset() -> int:
+    """Seconds until the next Pacific-midnight quota rollover"""
+    # Resolved here, not at import, so the module loads on hosts without tz data
+    now = datetime.now(ZoneInfo(QUOTA_RESET_TZ))
+    midnight = (now + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+    # Same-zone subtraction ignores UTC offsets, so compare in UTC (DST days are 23h/25h)
+    remaining = midnight.astimezone(timezone.utc) - now.astimezone(timezone.utc)
+    return max(60, int(remaining.total_seconds()))
+
+
+def _check_quota(cache: diskcache.Cache):
+    """Fail fast without a request while the quota sentinel is set"""
+    if cache.get(QUOTA_EXCEEDED_KEY):
+        raise QuotaExceededError("YouTube API quota exceeded; skipping request until quota reset")
+
+
+def _record_quota_error(cache: diskcache.Cache, status: int, content: bytes):
+    """Set the quota sentinel if a failed call was a 403 quotaExceeded"""
+    if status == 403 and b'quotaExceeded' in (content or b''):
+        cache.set(QUOTA_EXCEEDED_KEY, True, expire=_seconds_until_quota_reset())
+        logger.warning("⚠️  YouTube quota exceeded; pausing API calls until Pacific midnight")
+
+
+# 429 and 5xx are transient; 4xx auth/quota errors are never retried
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+MAX_ATTEMPTS = 3
+
+
+def _is_retryable(error: BaseException) -> bool:
+    """Whether a failed API call is worth retrying"""
+    from googleapiclient.errors import HttpError
+    
+    if isinstance(error, HttpError):
+        return error.resp.status in RETRYABLE_STATUS
+    return isinstance(error, (socket.timeout, ssl.SSLError, ConnectionError))
+
+
+def _log_retry(retry_state: RetryCallState):
+    """Report a failed attempt before tenacity sleeps"""
+    error = retry_state.outcome.exception()
+    logger.warning(
+        f"⚠️  YouTube error: {error} "
+        f"(attempt {retry_state.attempt_number}/{MAX_ATTEMPTS}), retrying..."
+    )
+
+
+@retry(
+    retry=retry_if_exception(_is_retryable),
+    stop=stop_after_attempt(MAX_ATTEMPTS),
+    wait=wait_exponential_jitter(initial=2, max=30),
+    before_sleep=_log_retry,
+    reraise=True
+)
+def _execute(request) -> Dict:
+    """Execute a googleapiclient request with capped, jittered exponential backoff"""
+    return request.execute()
 
 
 class YouTubeService:
     """Service for fetching Kenya news channel comments from YouTube"""
     
-    # ALL Kenya news channel IDs
-    KENYA_CHANNELS = {
+    # ALL Kenya news channel IDs (read-only; one key per channel ID)
+    KENYA_CHANNELS = MappingProxyType({
         # Major TV Stations
         'citizen_tv': 'UCr1ndHU7CP-Zd7tXoDsv9mA',      # Citizen TV Kenya
         'ktn_news': 'UCmulUe0S0-9MrXOIlNxfYjQ',         # KTN News Kenya
@@ -29,7 +178,6 @@ class YouTubeService:
         
         # Political/Analysis
         'trending_kenya': 'UCl4CG9BBPm1HUP4lWBfZl5g',   # Trending Kenya
-        'kenya_citizen_tv': 'UCr1ndHU7CP-Zd7tXoDsv9mA', # Kenya Citizen TV (backup)
         'spice_fm': 'UCpPNO6P2-1NqqI0FfX6nVig',         # Spice FM
         
         # Radio Stations (with video)
@@ -41,7 +189,15 @@ class YouTubeService:
         'inooro_tv': 'UCQ8S5JDyM9Xp2vKSmF8A7wA',        # Inooro TV
         'ramogi_tv': 'UCgqzCWCl0K4BLpfzZwP7dHQ',        # Ramogi TV
         'kass_tv': 'UC4kcQR8O9kL4XHH2RMKZN3w',          # Kass TV
-    }
+    })
+    
+    # Response cache TTLs (seconds)
+    SEARCH_CACHE_TTL = 3600      # Keyword searches
+    CHANNEL_CACHE_TTL = 900      # Date-ordered channel feeds
+    COMMENTS_CACHE_TTL = 3600    # Comment threads
+    
+    # Concurrent commentThreads requests per batch fetch
+    COMMENT_FETCH_CONCURRENCY = 8
     
     def __init__(self, api_key: str = None):
         """
@@ -51,10 +207,30 @@ class YouTubeService:
             api_key: YouTube Data API v3 key
         """
         self.api_key = api_key
-        self.youtube = None
+        self.youtube: Optional["Resource"] = None
+        self._http = None
         
         if api_key:
-            self.youtube = build('youtube', 'v3', developerKey=api_key)
+            self._initialize()
+    
+    def _initialize(self):
+        """Build the API client from the cached discovery document"""
+        from googleapiclient.discovery import build, build_from_document
+        import httplib2
+        
+        # One keep-alive transport for every search/comment/channel call
+        self._http = httplib2.Http(timeout=60)
+        
+        document = _discovery_document()
+        if document is None:
+            self.youtube = build(
+                'youtube', 'v3',
+                developerKey=self.api_key,
+                http=self._http,
+                cache_discovery=False
+            )
+        else:
+            self.youtube = build_from_document(document, developerKey=self.api_key, http=self._http)
     
     def search_kenya_videos(
         self,
@@ -76,69 +252,80 @@ class YouTubeService:
         if not self.youtube:
             return []
         
-        # Retry configuration
-        max_retries = 3
-        base_delay = 2  # seconds
+        params = self._search_params(query, max_results, published_after)
         
-        for attempt in range(max_retries):
-            try:
-                # Build request with longer timeout
-                request = self.youtube.search().list(
-                    part='snippet',
-                    q=query,
-                    type='video',
-                    maxResults=max_results,
-                    regionCode='KE',  # Kenya region
-                    relevanceLanguage='en',
-                    order='date'
+        try:
+            # Transient failures are retried inside _cached_execute
+            response = self._cached_execute('search', params, self.SEARCH_CACHE_TTL, tag=query)
+        except Exception as e:
+            logger.error(f"❌ YouTube API error: {e}")
+            return []
+        
+        videos = []
+        for item in response.get('items', []):
+            video = self._standardize_video(item)
+            videos.append(video)
+        
+        logger.info(f"📺 Found {len(videos)} YouTube videos on '{query}'")
+        return videos
+    
+    async def search_kenya_videos_async(
+        self,
+        query: str = "Kenya government policy",
+        max_results: int = 10,
+        published_after: str = None,
+        client: Optional[httpx.AsyncClient] = None
+    ) -> List[Dict]:
+        """
+        Search for Kenya-related videos over the REST API
+        
+        Args:
+            query: Search query
+            max_results: Maximum videos to return
+            published_after: ISO datetime string for filtering
+            client: Shared client from _rest_client (one is opened if omitted)
+            
+        Returns:
+            List of video dictionaries
+        """
+        if not self.api_key:
+            return []
+        
+        if client is None:
+            async with self._rest_client() as client:
+                return await self.search_kenya_videos_async(
+                    query, max_results, published_after, client
                 )
-                
-                # Execute with explicit timeout (60 seconds)
-                import socket
-                original_timeout = socket.getdefaulttimeout()
-                try:
-                    socket.setdefaulttimeout(60)  # 60 second timeout
-                    response = request.execute()
-                finally:
-                    socket.setdefaulttimeout(original_timeout)
-                
-                # Success - process results
-                videos = []
-                for item in response.get('items', []):
-                    video = self._standardize_video(item)
-                    videos.append(video)
-                
-                print(f"📺 Found {len(videos)} YouTube videos on '{query}'")
-                return videos
-                
-            except socket.timeout:
-                if attempt < max_retries - 1:
-                    delay = base_delay * (2 ** attempt)  # Exponential backoff
-                    print(f"⚠️  YouTube timeout (attempt {attempt + 1}/{max_retries}), retrying in {delay}s...")
-                    import time
-                    time.sleep(delay)
-                    continue
-                else:
-                    print(f"❌ YouTube timeout after {max_retries} attempts")
-                    return []
-                    
-            except Exception as e:
-                error_str = str(e).lower()
-                
-                # Retry on network errors
-                if any(x in error_str for x in ['timeout', 'timed out', 'ssl', 'connection']):
-                    if attempt < max_retries - 1:
-                        delay = base_delay * (2 ** attempt)
-                        print(f"⚠️  YouTube error: {e} (attempt {attempt + 1}/{max_retries}), retrying in {delay}s...")
-                        import time
-                        time.sleep(delay)
-                        continue
-                
-                # Don't retry on quota/auth errors
-                print(f"❌ YouTube API error: {e}")
-                return []
-        
-        return []
+        
+        params = self._search_params(query, max_results, published_after)
+        
+        try:
+            response = await self._get_json(
+                client, 'search', params, self.SEARCH_CACHE_TTL, tag=query
+            )
+        except Exception as e:
+            logger.error(f"❌ YouTube API error: {e}")
+            return []
+        
+        videos = [self._standardize_video(item) for item in response.get('items', [])]
+        logger.info(f"📺 Found {len(videos)} YouTube videos on '{query}'")
+        return videos
+    
+    def _search_params(self, query: str, max_results: int, published_after: Optional[str]) -> Dict:
+        """search.list params for a Kenya keyword search"""
+        params = {
+            'part': 'snippet',
+            'q': query,
+            'type': 'video',
+            'maxResults': max_results,
+            'regionCode': 'KE',  # Kenya region
+            'relevanceLanguage': 'en',
+            'order': 'date',
+            'fields': SEARCH_FIELDS
+        }
+        if published_after:
+            params['publishedAfter'] = published_after
+        return params
     
     def get_video_comments(
         self,
@@ -159,13 +346,13 @@ class YouTubeService:
             return []
         
         try:
-            request = self.youtube.commentThreads().list(
-                part='snippet',
-                videoId=video_id,
-                maxResults=min(max_results, 100),
-                order='relevance'
-            )
-            response = request.execute()
+            response = self._cached_execute('commentThreads', {
+                'part': 'snippet',
+                'videoId': video_id,
+                'maxResults': min(max_results, 100),
+                'order': 'relevance',
+                'fields': COMMENT_FIELDS
+            }, self.COMMENTS_CACHE_TTL)
             
             comments = []
             for item in response.get('items', []):
@@ -175,9 +362,168 @@ class YouTubeService:
             return comments
             
         except Exception as e:
-            print(f"Error fetching comments: {e}")
+            logger.error(f"Error fetching comments: {e}")
+            return []
+    
+    def _cached_execute(self, endpoint: str, params: Dict, ttl: int, tag: str = None) -> Dict:
+        """
+        Run a googleapiclient list() call, serving the raw response from cache when fresh
+        
+        Args:
+            endpoint: API resource name ('search', 'commentThreads')
+            params: Query parameters for list()
+            ttl: Seconds to keep the response (empty results expire sooner)
+            tag: Optional tag so the entry can be dropped with invalidate()
+            
+        Returns:
+            Raw API response
+            
+        Raises:
+            QuotaExceededError: While the daily quota is known to be exhausted
+        """
+        from googleapiclient.errors import HttpError
+        
+        cache = _response_cache()
+        key = _request_key(endpoint, params)
+        response = cache.get(key)
+        if response is None:
+            _check_quota(cache)
+            try:
+                response = _execute(getattr(self.youtube, endpoint)().list(**params))
+            except HttpError as e:
+                _record_quota_error(cache, e.resp.status, e.content)
+                raise
+            cache.set(key, response, expire=_response_ttl(response, ttl), tag=tag)
+        return response
+    
+    def invalidate(self, query: Optional[str] = None):
+        """
+        Drop cached API responses
+        
+        Args:
+            query: Only drop cached searches for this query (all responses if omitted)
+        """
+        cache = _response_cache()
+        if query is None:
+            cache.clear()
+        else:
+            cache.evict(query)
+    
+    def _rest_client(self) -> httpx.AsyncClient:
+        """Pooled HTTP/2 client for direct YouTube Data API calls"""
+        return httpx.AsyncClient(
+            base_url=YOUTUBE_API_URL,
+            headers={'X-Goog-Api-Key': self.api_key},
+            http2=True,
+            timeout=30,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=20)
+        )
+    
+    async def _get_json(
+        self,
+        client: httpx.AsyncClient,
+        endpoint: str,
+        params: Dict,
+        ttl: int,
+        tag: str = None
+    ) -> Dict:
+        """GET a YouTube Data API endpoint, serving the raw JSON from cache when fresh"""
+        cache = _response_cache()
+        key = _request_key(endpoint, params)
+        data = cache.get(key)
+        if data is not None:
+            return data
+        
+        _check_quota(cache)
+        response = await client.get(f"/{endpoint}", params=params)
+        if response.is_error:
+            _record_quota_error(cache, response.status_code, response.content)
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+        cache.set(key, data, expire=_response_ttl(data, ttl), tag=tag)
+        return data
+    
+    async def get_video_comments_async(
+        self,
+        video_id: str,
+        max_results: int = 100,
+        client: Optional[httpx.AsyncClient] = None
+    ) -> List[Dict]:
+        """
+        Fetch comments from a specific video over the REST API
+        
+        Args:
+            video_id: YouTube video ID
+            max_results: Maximum comments to return
+            client: Shared client from _rest_client (one is opened if omitted)
+            
+        Returns:
+            List of comment dictionaries
+        """
+        if not self.api_key:
+            return []
+        
+        if client is None:
+            async with self._rest_client() as client:
+                return await self.get_video_comments_async(video_id, max_results, client)
+        
+        try:
+            response = await self._get_json(client, 'commentThreads', {
+                'part': 'snippet',
+                'videoId': video_id,
+                'maxResults': min(max_results, 100),
+                'order': 'relevance',
+                'fields': COMMENT_FIELDS
+            }, self.COMMENTS_CACHE_TTL)
+            return [self._standardize_comment(item) for item in response.get('items', [])]
+            
+        except Exception as e:
+            logger.error(f"Error fetching comments: {e}")
             return []
     
+    async def get_comments_for_videos_async(
+        self,
+        video_ids: List[str],
+        max_per_video: int = 50,
+        client: Optional[httpx.AsyncClient] = None
+    ) -> List[List[Dict]]:
+        """
+        Fetch comments for several videos concurrently over one connection pool
+        
+        At most COMMENT_FETCH_CONCURRENCY requests are in flight at once, so a
+        long video list is fetched in waves instead of bursting the quota.
+        
+        Args:
+            video_ids: YouTube video IDs
+            max_per_video: Maximum comments per video
+            client: Shared client from _rest_client (one is opened if omitted)
+            
+        Returns:
+            Comment lists in the same order as video_ids
+        """
+        if not self.api_key:
+            return [[] for _ in video_ids]
+        
+        if client is None:
+            async with self._rest_client() as client:
+                return await self.get_comments_for_videos_async(video_ids, max_per_video, client)
+        
+        semaphore = asyncio.Semaphore(self.COMMENT_FETCH_CONCURRENCY)
+        
+        async def fetch(video_id: str) -> List[Dict]:
+            async with semaphore:
+                return await self.get_video_comments_async(video_id, max_per_video, client)
+        
+        return await asyncio.gather(*[fetch(video_id) for video_id in video_ids])
+    
+    def get_comments_for_videos(
+        self,
+        video_ids: List[str],
+        max_per_video: int = 50
+    ) -> List[List[Dict]]:
+        """Sync wrapper around get_comments_for_videos_async"""
+        return run_sync(self.get_comments_for_videos_async(video_ids, max_per_video))
+    
     def get_channel_videos(
         self,
         channel_name: str,
@@ -198,14 +544,9 @@ class YouTubeService:
             return []
         
         try:
-            request = self.youtube.search().list(
-                part='snippet',
-                channelId=channel_id,
-                maxResults=max_results,
-                order='date',
-                type='video'
+            response = self._cached_execute(
+                'search', _channel_search_params(channel_id, max_results), self.CHANNEL_CACHE_TTL
             )
-            response = request.execute()
             
             videos = []
             for item in response.get('items', []):
@@ -215,9 +556,77 @@ class YouTubeService:
             return videos
             
         except Exception as e:
-            print(f"Error fetching channel videos: {e}")
+            logger.error(f"Error fetching channel videos: {e}")
             return []
     
+    async def get_channel_videos_async(
+        self,
+        channel_name: str,
+        max_results: int = 10,
+        client: Optional[httpx.AsyncClient] = None
+    ) -> List[Dict]:
+        """
+        Get recent videos from a Kenya news channel over the REST API
+        
+        Args:
+            channel_name: Channel key from KENYA_CHANNELS
+            max_results: Maximum videos to return
+            client: Shared client from _rest_client (one is opened if omitted)
+            
+        Returns:
+            List of video dictionaries
+        """
+        channel_id = self.KENYA_CHANNELS.get(channel_name)
+        if not channel_id or not self.api_key:
+            return []
+        
+        if client is None:
+            async with self._rest_client() as client:
+                return await self.get_channel_videos_async(channel_name, max_results, client)
+        
+        params = _channel_search_params(channel_id, max_results)
+        return await self._fetch_channel_videos(client, params)
+    
+    async def _fetch_channel_videos(self, client: httpx.AsyncClient, params: Mapping) -> List[Dict]:
+        """Run one prebuilt channel search and standardize the videos"""
+        try:
+            response = await self._get_json(client, 'search', params, self.CHANNEL_CACHE_TTL)
+            return [self._standardize_video(item) for item in response.get('items', [])]
+            
+        except Exception as e:
+            logger.error(f"Error fetching channel videos: {e}")
+            return []
+    
+    async def get_all_channel_videos_async(self, max_results: int = 10) -> Dict[str, List[Dict]]:
+        """
+        Get recent videos from every Kenya channel concurrently
+        
+        Args:
+            max_results: Maximum videos per channel
+            
+        Returns:
+            Dictionary of channel key -> list of video dictionaries
+        """
+        if not self.api_key:
+            return {}
+        
+        sweep = _channel_sweep(max_results)
+        async with self._rest_client() as client:
+            results = await asyncio.gather(*[
+                self._fetch_channel_videos(client, params)
+                for _, params in sweep
+            ])
+        return {name: videos for (name, _), videos in zip(sweep, results)}
+    
+    def iter_unique_channels(self) -> Iterator[Tuple[str, str]]:
+        """Yield (channel key, channel ID) once per distinct channel ID"""
+        for channel_id, name in _UNIQUE_CHANNELS.items():
+            yield name, channel_id
+    
+    def get_all_channel_videos(self, max_results: int = 10) -> Dict[str, List[Dict]]:
+        """Sync wrapper around get_all_channel_videos_async"""
+        return run_sync(self.get_all_channel_videos_async(max_results))
+    
     def _standardize_video(self, item: Dict) -> Dict:
         """Convert YouTube video to standardized format"""
         snippet = item.get('snippet', {})
@@ -248,5 +657,49 @@ class YouTubeService:
         }
 
 
-# Will be initialized with API key from environment
-youtube_service = YouTubeService()
+def _unique_channels() -> Dict[str, str]:
+    """Channel ID -> canonical key, in listing order; the first key for an ID wins"""
+    unique = {}
+    for name, channel_id in YouTubeService.KENYA_CHANNELS.items():
+        unique.setdefault(channel_id, name)
+    return unique
+
+
+# A full sweep never fetches the same channel twice
+_UNIQUE_CHANNELS = _unique_channels()
+
+
+@lru_cache(maxsize=None)
+def _channel_search_params(channel_id: str, max_results: int) -> Mapping:
+    """Read-only search.list params for a channel's latest videos, built once"""
+    return MappingProxyType({
+        'part': 'snippet',
+        'channelId': channel_id,
+        'maxResults': max_results,
+        'order': 'date',
+        'type': 'video',
+        'fields': SEARCH_FIELDS
+    })
+
+
+@lru_cache(maxsize=None)
+def _channel_sweep(max_results: int) -> Tuple[Tuple[str, Mapping], ...]:
+    """(channel key, search params) for every unique channel, reused by each full sweep"""
+    return tuple(
+        (name, _channel_search_params(channel_id, max_results))
+        for channel_id, name in _UNIQUE_CHANNELS.items()
+    )
+
+
+# Created on first access; initialized with API key from environment at startup
+_youtube_service: Optional[YouTubeService] = None
+
+
+def __getattr__(name: str):
+    """Lazily create the youtube_service singleton (PEP 562 module attribute hook)"""
+    global _youtube_service
+    if name == "youtube_service":
+        if _youtube_service is None:
+            _youtube_service = YouTubeService()
+        return _youtube_service
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,11 +2,45 @@
 Vector Service
 Manages document embeddings and semantic search using Qdrant
 """
-from qdrant_client import QdrantClient
-from qdrant_client.models import Distance, VectorParams, PointStruct
-from sentence_transformers import SentenceTransformer
-from typing import List, Dict
+from functools import lru_cache
+from typing import TYPE_CHECKING, List, Dict, Optional
+import asyncio
 import hashlib
+import logging
+import os
+import numpy as np
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# torch/transformers and the Qdrant client are imported on first use, so
+# workers that never touch the vector path don't pay for them
+if TYPE_CHECKING:
+    from qdrant_client import AsyncQdrantClient
+    from qdrant_client.models import PointStruct, ScalarQuantization, SearchParams
+    from sentence_transformers import SentenceTransformer
+
+
+@lru_cache(maxsize=1)
+def _quantization_config() -> "ScalarQuantization":
+    """int8 scalar quantization: 4x smaller vectors kept in RAM, originals stay on disk"""
+    from qdrant_client.models import ScalarQuantization, ScalarQuantizationConfig, ScalarType
+    return ScalarQuantization(
+        scalar=ScalarQuantizationConfig(
+            type=ScalarType.INT8,
+            quantile=0.99,
+            always_ram=True
+        )
+    )
+
+
+@lru_cache(maxsize=1)
+def _search_params() -> "SearchParams":
+    """Score on the int8 vectors, then rescore the top candidates with the originals"""
+    from qdrant_client.models import QuantizationSearchParams, SearchParams
+    return SearchParams(
+        quantization=QuantizationSearchParams(rescore=True, oversampling=2.0)
+    )
 
 
 class VectorService:
@@ -23,16 +57,22 @@ class VectorService:
         self.qdrant_url = qdrant_url
         self.qdrant_key = qdrant_key
         self.client = None
+        self.async_client: Optional["AsyncQdrantClient"] = None
         self.embeddings_model = None
         self.collection_name = "govgpt_documents"
         self.vector_size = 384  # all-MiniLM-L6-v2 dimension
         
+        # Query embeddings cached per instance (chat UIs resend the same query)
+        self._embed_cached = lru_cache(maxsize=2048)(self._embed_uncached)
+        
         if qdrant_url and qdrant_key:
             self._initialize()
     
     def _initialize(self):
         """Initialize Qdrant client and embeddings model"""
         try:
+            from qdrant_client import QdrantClient
+            
             # Connect to Qdrant
             self.client = QdrantClient(
                 url=self.qdrant_url,
@@ -40,20 +80,66 @@ class VectorService:
             )
             
             # Load embeddings model
-            print("Loading embeddings model...")
-            self.embeddings_model = SentenceTransformer('sentence-transformers/all-MiniLM-L6-v2')
+            logger.info("Loading embeddings model...")
+            self.embeddings_model = self._load_embeddings_model()
+            self.clear_cache()
             
             # Create collection if it doesn't exist
             self._ensure_collection()
             
-            print("✅ Vector service initialized")
+            logger.info("✅ Vector service initialized")
             
         except Exception as e:
-            print(f"❌ Failed to initialize vector service: {e}")
+            logger.error(f"❌ Failed to initialize vector service: {e}")
             raise
     
+    def _load_embeddings_model(self) -> "SentenceTransformer":
+        """
+        Load the sentence encoder, preferring ONNX Runtime over PyTorch eager mode
+        
+        The ONNX graph is pre-exported on the model hub (including an INT8
+        quantized variant), so nothing is exported at startup. Pooling and
+        normalization stay inside SentenceTransformer, so encode() is unchanged.
+        
+        Returns:
+            SentenceTransformer instance
+        """
+        from sentence_transformers import SentenceTransformer
+        
+        model_name = settings.EMBEDDING_MODEL
+        
+        if settings.EMBEDDING_BACKEND == "onnx":
+            try:
+                import onnxruntime as ort
+                
+                session_options = ort.SessionOptions()
+                session_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+                session_options.intra_op_num_threads = max(1, (os.cpu_count() or 2) // 2)
+                
+                model = SentenceTransformer(
+                    model_name,
+                    backend="onnx",
+                    model_kwargs={
+                        "file_name": settings.EMBEDDING_ONNX_FILE,
+                        "provider": "CPUExecutionProvider",
+                        "session_options": session_options,
+                    }
+                )
+                logger.info(
+                    f"✅ Embeddings model loaded with ONNX Runtime ({settings.EMBEDDING_ONNX_FILE})"
+                )
+                return model
+            except Exception as e:
+                logger.warning(
+                    f"⚠️ ONNX embeddings backend unavailable, falling back to PyTorch: {e}"
+                )
+        
+        return SentenceTransformer(model_name)
+    
     def _ensure_collection(self):
-        """Create collection if it doesn't exist"""
+        """Create collection if it doesn't exist, and make sure it is int8-quantized"""
+        from qdrant_client.models import Distance, VectorParams
+        
         try:
             collections = self.client.get_collections().collections
             exists = any(c.name == self.collection_name for c in collections)
@@ -64,15 +150,26 @@ class VectorService:
                     vectors_config=VectorParams(
                         size=self.vector_size,
                         distance=Distance.COSINE
-                    )
+                    ),
+                    quantization_config=_quantization_config()
                 )
-                print(f"✅ Created collection: {self.collection_name}")
+                logger.info(f"✅ Created collection: {self.collection_name}")
+            else:
+                # Existing FP32 collections are quantized in place; the original
+                # vectors are kept, so search keeps working during the rebuild
+                info = self.client.get_collection(self.collection_name)
+                if info.config.quantization_config is None:
+                    self.client.update_collection(
+                        collection_name=self.collection_name,
+                        quantization_config=_quantization_config()
+                    )
+                    logger.info(f"✅ Enabled int8 quantization on: {self.collection_name}")
             
         except Exception as e:
-            print(f"Error creating collection: {e}")
+            logger.error(f"Error creating collection: {e}")
             raise
     
-    def embed_text(self, text: str) -> List[float]:
+    def embed_text(self, text: str) -> np.ndarray:
         """
         Generate embedding for text
         
@@ -80,40 +177,107 @@ class VectorService:
             text: Text to embed
             
         Returns:
-            Embedding vector
+            L2-normalized float32 embedding vector (read-only, shared via the cache)
         """
         if not self.embeddings_model:
             raise Exception("Embeddings model not initialized")
         
-        embedding = self.embeddings_model.encode(text)
-        return embedding.tolist()
+        return self._embed_cached(text)
     
-    def store_chunks(self, chunks: List[Dict], document_id: str):
+    def _embed_uncached(self, text: str) -> np.ndarray:
+        """Run the encoder; the array is frozen so cached copies can't be mutated"""
+        embedding = self.embeddings_model.encode(
+            text,
+            convert_to_numpy=True,
+            normalize_embeddings=True
+        ).astype(np.float32, copy=False)
+        embedding.flags.writeable = False
+        return embedding
+    
+    def clear_cache(self):
+        """Drop cached query embeddings (e.g. after swapping the model)"""
+        self._embed_cached.cache_clear()
+    
+    async def store_chunks_async(self, chunks: List[Dict], document_id: str, wait: bool = False):
         """
-        Store document chunks in Qdrant
+        Store document chunks in Qdrant, overlapping embedding with upload
+        
+        Pipeline: batch N+1 is encoded on a worker thread while batch N is
+        upserted over gRPC. At most one upsert is pending, so memory stays
+        bounded to two batches.
         
         Args:
             chunks: List of text chunks with metadata
             document_id: Unique document identifier
+            wait: Block until each batch is indexed (False returns once queued)
         """
-        if not self.client:
-            raise Exception("Qdrant client not initialized")
+        if not self.client or not self.embeddings_model:
+            raise Exception("Vector service not initialized")
         
-        points = []
+        client = self._get_async_client()
+        batch_size = 64
+        pending = None
         
-        for chunk in chunks:
-            # Generate embedding
-            embedding = self.embed_text(chunk['text'])
+        try:
+            for i in range(0, len(chunks), batch_size):
+                # Encoding is CPU-bound; keep it off the event loop
+                points = await asyncio.to_thread(
+                    self._build_points, chunks[i:i + batch_size], document_id
+                )
+                
+                if pending is not None:
+                    await pending  # Surface upload errors before queueing more
+                pending = asyncio.create_task(client.upsert(
+                    collection_name=self.collection_name,
+                    points=points,
+                    wait=wait
+                ))
             
-            # Create unique point ID
-            point_id = hashlib.md5(
-                f"{document_id}_{chunk['chunk_id']}".encode()
-            ).hexdigest()[:16]
+            if pending is not None:
+                await pending
+        finally:
+            if pending is not None and not pending.done():
+                pending.cancel()
+        
+        logger.info(f"✅ Stored {len(chunks)} chunks for document {document_id}")
+    
+    def _get_async_client(self) -> "AsyncQdrantClient":
+        """Open the gRPC client on first use (inside the running loop) and reuse it"""
+        if self.async_client is None:
+            from qdrant_client import AsyncQdrantClient
             
-            # Create point
-            point = PointStruct(
-                id=point_id,
-                vector=embedding,
+            self.async_client = AsyncQdrantClient(
+                url=self.qdrant_url,
+                api_key=self.qdrant_key,
+                prefer_grpc=True
+            )
+        return self.async_client
+    
+    async def close_async_client(self):
+        """Close the shared gRPC client (call on app shutdown)"""
+        if self.async_client is not None:
+            await self.async_client.close()
+            self.async_client = None
+    
+    def _build_points(self, chunks: List[Dict], document_id: str) -> List["PointStruct"]:
+        """Embed chunks in batched forward passes and wrap them as Qdrant points"""
+        from qdrant_client.models import PointStruct
+        
+        if not self.embeddings_model:
+            raise Exception("Embeddings model not initialized")
+        
+        embeddings = self.embeddings_model.encode(
+            [chunk['text'] for chunk in chunks],
+            batch_size=64,
+            show_progress_bar=False,
+            convert_to_numpy=True,
+            normalize_embeddings=True
+        )
+        
+        return [
+            PointStruct(
+                id=self._point_id(document_id, chunk['chunk_id']),
+                vector=embedding.tolist(),
                 payload={
                     'document_id': document_id,
                     'chunk_id': chunk['chunk_id'],
@@ -124,18 +288,20 @@ class VectorService:
                     'end': chunk.get('end', 0)
                 }
             )
-            points.append(point)
-        
-        # Upload in batches of 100
-        batch_size = 100
-        for i in range(0, len(points), batch_size):
-            batch = points[i:i + batch_size]
-            self.client.upsert(
-                collection_name=self.collection_name,
-                points=batch
-            )
+            for chunk, embedding in zip(chunks, embeddings)
+        ]
+    
+    @staticmethod
+    def _point_id(document_id: str, chunk_id) -> int:
+        """
+        Deterministic 64-bit integer point ID for a chunk
         
-        print(f"✅ Stored {len(points)} chunks for document {document_id}")
+        blake2b-64 of "<document_id>_<chunk_id>", so re-uploading a document
+        overwrites its points. IDs are never reconstructed for deletes:
+        delete_document filters on the document_id payload instead.
+        """
+        digest = hashlib.blake2b(f"{document_id}_{chunk_id}".encode(), digest_size=8).digest()
+        return int.from_bytes(digest, 'big')
     
     def search_similar(self, query: str, limit: int = 5) -> List[Dict]:
         """
@@ -158,7 +324,8 @@ class VectorService:
         results = self.client.search(
             collection_name=self.collection_name,
             query_vector=query_embedding,
-            limit=limit
+            limit=limit,
+            search_params=_search_params()
         )
         
         # Format results
@@ -175,7 +342,7 @@ class VectorService:
         return similar_chunks
     
     def delete_document(self, document_id: str):
-        """Delete all chunks for a document"""
+        """Delete all chunks for a document (by document_id payload, not point ID)"""
         if not self.client:
             raise Exception("Qdrant client not initialized")
         
@@ -192,8 +359,18 @@ class VectorService:
                 }
             }
         )
-        print(f"✅ Deleted chunks for document {document_id}")
+        logger.info(f"✅ Deleted chunks for document {document_id}")
+
+
+# Singleton instance, created on first access (initialized with credentials from config at startup)
+_vector_service: Optional[VectorService] = None
 
 
-# Singleton instance (will be initialized with credentials from config)
-vector_service = VectorService()
+def __getattr__(name: str):
+    """Lazily create the vector_service singleton (PEP 562 module attribute hook)"""
+    global _vector_service
+    if name == "vector_service":
+        if _vector_service is None:
+            _vector_service = VectorService()
+        return _vector_service
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
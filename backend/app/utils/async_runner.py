@@ -0,0 +1,30 @@
+"""
+Async Runner Utility
+Runs coroutines from the synchronous service layer
+"""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Coroutine
+
+
+def run_sync(coro: Coroutine) -> Any:
+    """
+    Run a coroutine to completion from synchronous code
+
+    Sync routes and generators call services directly, sometimes from a
+    thread that already has a running event loop (async FastAPI handlers).
+    In that case the coroutine runs on its own loop in a helper thread.
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, coro).result()
@@ -0,0 +1,59 @@
+"""
+Logging Setup Utility
+Routes stdlib logging through a queue so handler I/O runs off the request path
+"""
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+import logging
+import queue
+
+_listener: Optional[QueueListener] = None
+_queue_handler: Optional[QueueHandler] = None
+
+
+def setup_logging(level: str = "INFO") -> QueueListener:
+    """
+    Configure the root logger with a QueueHandler drained by a background thread
+
+    Callers only enqueue records; the listener thread formats them and writes
+    to stderr. Safe to call more than once (later calls just update the level).
+
+    Args:
+        level: Root log level name
+
+    Returns:
+        The running QueueListener
+    """
+    global _listener, _queue_handler
+
+    root = logging.getLogger()
+    root.setLevel(level.upper())
+
+    if _listener is None:
+        log_queue = queue.SimpleQueue()
+
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(
+            logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
+        )
+
+        _queue_handler = QueueHandler(log_queue)
+        root.addHandler(_queue_handler)
+        _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+        _listener.start()
+
+    return _listener
+
+
+def shutdown_logging():
+    """Detach the queue handler, flush queued records and stop the listener thread"""
+    global _listener, _queue_handler
+
+    # Detach first so nothing is enqueued after the listener stops draining
+    if _queue_handler is not None:
+        logging.getLogger().removeHandler(_queue_handler)
+        _queue_handler = None
+
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
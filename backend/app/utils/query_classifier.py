@@ -2,7 +2,107 @@
 Query Classification Utility
 Determines if a user query needs a decision report or exploratory response
 """
+from functools import lru_cache
+from typing import Dict, Set, Tuple
+import ahocorasick
 
+# Strong decision indicators (high confidence)
+STRONG_DECISION_KEYWORDS = (
+    'should we', 'should i', 'should kenya', 'should the',
+    'recommend', 'approval', 'approve', 'decide',
+    'allocate', 'reallocate', 'fund', 'defund',
+    'implement', 'adopt', 'reject', 'accept',
+    'expand', 'reduce', 'increase', 'decrease',
+    'prioritize', 'choose between', 'select',
+    'go ahead', 'proceed with', 'move forward'
+)
+
+# Moderate decision indicators
+MODERATE_DECISION_KEYWORDS = (
+    'policy', 'budget', 'funding', 'investment',
+    'program', 'initiative', 'project',
+    'benefits', 'costs', 'trade-offs', 'tradeoffs',
+    'impact', 'consequences', 'effects',
+    'options', 'alternatives', 'choices'
+)
+
+# Exploratory indicators (override decision classification)
+EXPLORATORY_KEYWORDS = (
+    'what is', 'what are', 'who is', 'who are',
+    'when did', 'when was', 'where is', 'where are',
+    'how does', 'how do', 'how did',
+    'explain', 'describe', 'define', 'tell me about',
+    'history of', 'background on', 'overview of',
+    'summarize', 'summary of', 'list', 'show me'
+)
+
+# Keywords counted for the confidence score
+CONFIDENCE_KEYWORDS = {
+    'strong': ('should', 'approve', 'recommend', 'decide'),
+    'moderate': ('policy', 'budget', 'impact', 'options'),
+    'exploratory': ('what is', 'explain', 'history'),
+}
+
+_KEYWORD_GROUPS = {
+    'strong_decision': STRONG_DECISION_KEYWORDS,
+    'moderate_decision': MODERATE_DECISION_KEYWORDS,
+    'exploratory': EXPLORATORY_KEYWORDS,
+    'confidence_strong': CONFIDENCE_KEYWORDS['strong'],
+    'confidence_moderate': CONFIDENCE_KEYWORDS['moderate'],
+    'confidence_exploratory': CONFIDENCE_KEYWORDS['exploratory'],
+}
+
+
+def _build_automaton() -> ahocorasick.Automaton:
+    """Build one automaton tagging every keyword with the groups it belongs to"""
+    groups_by_keyword = {}
+    for group, keywords in _KEYWORD_GROUPS.items():
+        for keyword in keywords:
+            groups_by_keyword.setdefault(keyword, set()).add(group)
+    
+    automaton = ahocorasick.Automaton()
+    for keyword, groups in groups_by_keyword.items():
+        automaton.add_word(keyword, (keyword, frozenset(groups)))
+    automaton.make_automaton()
+    return automaton
+
+
+_KEYWORD_AUTOMATON = _build_automaton()
+
+
+def _match_keywords(lower_msg: str) -> Dict[str, Set[str]]:
+    """Scan the message once and return the distinct keywords matched per group"""
+    matches = {group: set() for group in _KEYWORD_GROUPS}
+    for _, (keyword, groups) in _KEYWORD_AUTOMATON.iter(lower_msg):
+        for group in groups:
+            matches[group].add(keyword)
+    return matches
+
+
+def _classify(lower_msg: str, matches: Dict[str, Set[str]]) -> str:
+    """Classify a lowercased message from its keyword matches"""
+    # Check for strong exploratory indicators first
+    if matches['exploratory']:
+        # Exception: "what should" or "how should" are still decision queries
+        if 'should' in lower_msg:
+            return 'decision'
+        return 'exploratory'
+    
+    # Check for strong decision indicators
+    if matches['strong_decision']:
+        return 'decision'
+    
+    # Check for moderate decision indicators + question structure
+    if matches['moderate_decision']:
+        # If it ends with a question mark and contains decision context
+        if '?' in lower_msg:
+            return 'decision'
+    
+    # Default to exploratory for general questions
+    return 'exploratory'
+
+
+@lru_cache(maxsize=1024)
 def classify_query(message: str) -> str:
     """
     Classify user query as 'decision' or 'exploratory'
@@ -24,58 +124,11 @@ def classify_query(message: str) -> str:
         
     Returns:
         'decision' or 'exploratory'
+    
+    Results are memoized: identical prompts recur across retries and UI echoes.
     """
     lower_msg = message.lower().strip()
-    
-    # Strong decision indicators (high confidence)
-    strong_decision_keywords = [
-        'should we', 'should i', 'should kenya', 'should the',
-        'recommend', 'approval', 'approve', 'decide',
-        'allocate', 'reallocate', 'fund', 'defund',
-        'implement', 'adopt', 'reject', 'accept',
-        'expand', 'reduce', 'increase', 'decrease',
-        'prioritize', 'choose between', 'select',
-        'go ahead', 'proceed with', 'move forward'
-    ]
-    
-    # Moderate decision indicators
-    moderate_decision_keywords = [
-        'policy', 'budget', 'funding', 'investment',
-        'program', 'initiative', 'project',
-        'benefits', 'costs', 'trade-offs', 'tradeoffs',
-        'impact', 'consequences', 'effects',
-        'options', 'alternatives', 'choices'
-    ]
-    
-    # Exploratory indicators (override decision classification)
-    exploratory_keywords = [
-        'what is', 'what are', 'who is', 'who are',
-        'when did', 'when was', 'where is', 'where are',
-        'how does', 'how do', 'how did',
-        'explain', 'describe', 'define', 'tell me about',
-        'history of', 'background on', 'overview of',
-        'summarize', 'summary of', 'list', 'show me'
-    ]
-    
-    # Check for strong exploratory indicators first
-    if any(keyword in lower_msg for keyword in exploratory_keywords):
-        # Exception: "what should" or "how should" are still decision queries
-        if 'should' in lower_msg:
-            return 'decision'
-        return 'exploratory'
-    
-    # Check for strong decision indicators
-    if any(keyword in lower_msg for keyword in strong_decision_keywords):
-        return 'decision'
-    
-    # Check for moderate decision indicators + question structure
-    if any(keyword in lower_msg for keyword in moderate_decision_keywords):
-        # If it ends with a question mark and contains decision context
-        if '?' in lower_msg:
-            return 'decision'
-    
-    # Default to exploratory for general questions
-    return 'exploratory'
+    return _classify(lower_msg, _match_keywords(lower_msg))
 
 
 def get_query_confidence(message: str) -> dict:
@@ -89,17 +142,27 @@ def get_query_confidence(message: str) -> dict:
             'reasoning': str
         }
     """
-    classification = classify_query(message)
+    classification, confidence, reasoning = _score_query(message)
+    
+    # Fresh dict per call so callers can't mutate the cached result
+    return {
+        'type': classification,
+        'confidence': confidence,
+        'reasoning': reasoning
+    }
+
+
+@lru_cache(maxsize=1024)
+def _score_query(message: str) -> Tuple[str, float, str]:
+    """Classification, confidence and reasoning for a message (memoized)"""
     lower_msg = message.lower().strip()
+    matches = _match_keywords(lower_msg)
+    classification = _classify(lower_msg, matches)
     
     # Calculate confidence based on keyword matches
-    strong_keywords = ['should', 'approve', 'recommend', 'decide']
-    moderate_keywords = ['policy', 'budget', 'impact', 'options']
-    exploratory_keywords = ['what is', 'explain', 'history']
-    
-    strong_matches = sum(1 for kw in strong_keywords if kw in lower_msg)
-    moderate_matches = sum(1 for kw in moderate_keywords if kw in lower_msg)
-    exploratory_matches = sum(1 for kw in exploratory_keywords if kw in lower_msg)
+    strong_matches = len(matches['confidence_strong'])
+    moderate_matches = len(matches['confidence_moderate'])
+    exploratory_matches = len(matches['confidence_exploratory'])
     
     if classification == 'decision':
         if strong_matches >= 2:
@@ -122,8 +185,4 @@ def get_query_confidence(message: str) -> dict:
             confidence = 0.70
             reasoning = "No strong decision indicators"
     
-    return {
-        'type': classification,
-        'confidence': confidence,
-        'reasoning': reasoning
-    }
+    return classification, confidence, reasoning
@@ -0,0 +1,11 @@
+"""
+Pytest configuration for the GovGPT backend
+Puts backend/ on sys.path once so tests and scripts can import `app`
+"""
+import os
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
@@ -1,9 +1,6 @@
 """
 Test script for Pan-African RSS service
 """
-import sys
-sys.path.append('/Users/Mukira/gov-analysis-platform/backend')
-
 from app.services.news.african_rss_service import african_rss_service
 
 print("🌍 Testing Pan-African RSS Feeds")
@@ -1,9 +1,6 @@
 """
 COMPREHENSIVE TEST: All Social Media + Sentiment Integration
 """
-import sys
-sys.path.append('/Users/Mukira/gov-analysis-platform/backend')
-
 from app.services.social_media.social_aggregator import social_aggregator
 
 print("🌐 TESTING FULL SOCIAL MEDIA INTEGRATION")
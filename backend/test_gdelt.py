@@ -1,9 +1,6 @@
 """
 Test script for GDELT service
 """
-import sys
-sys.path.append('/Users/Mukira/gov-analysis-platform/backend')
-
 from app.services.news.gdelt_service import gdelt_service
 
 # Test fetching Kenya news
@@ -1,9 +1,6 @@
 """
 Test enhanced Kenya GDELT queries
 """
-import sys
-sys.path.append('/Users/Mukira/gov-analysis-platform/backend')
-
 from app.services.news.gdelt_service import gdelt_service
 
 print("🔍 Testing Enhanced Kenya Queries with GDELT")
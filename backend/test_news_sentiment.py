@@ -2,9 +2,6 @@
 Test Sentiment Analysis with existing news sources (GDELT + RSS)
 No extra API setup required!
 """
-import sys
-sys.path.append('/Users/Mukira/gov-analysis-platform/backend')
-
 from app.services.news.gdelt_service import gdelt_service
 from app.services.news.african_rss_service import african_rss_service
 from app.services.social_media.sentiment_service import sentiment_analyzer
@@ -2,64 +2,77 @@
 Test Reddit + Sentiment Analysis Integration
 Fetch Kenya posts from Reddit and analyze sentiment
 """
+from collections import Counter
 import sys
-sys.path.append('/Users/Mukira/gov-analysis-platform/backend')
 
 from app.services.social_media.reddit_service import reddit_service
 from app.services.social_media.sentiment_service import sentiment_analyzer
 
-print("🔍 Testing Reddit + Sentiment Analysis for Kenya")
-print("=" * 70)
 
-# Step 1: Fetch Kenya posts
-print("\n📱 Step 1: Fetching posts from Kenya subreddits...")
-print("-" * 70)
-
-posts = reddit_service.fetch_kenya_posts(
-    keywords=['government', 'policy', 'president', 'parliament'],
-    limit=10,
-    time_filter='week'
-)
-
-print(f"✅ Fetched {len(posts)} Kenya posts\n")
-
-# Step 2: Analyze sentiment for each post
-print("\n🧠 Step 2: Analyzing sentiment...")
-print("-" * 70)
-
-for i, post in enumerate(posts[:5], 1):
+def test_reddit_sentiment():
+    """Fetch Kenya Reddit posts and report their sentiment"""
+    print("🔍 Testing Reddit + Sentiment Analysis for Kenya")
+    print("=" * 70)
+    
+    # Step 1: Fetch Kenya posts
+    print("\n📱 Step 1: Fetching posts from Kenya subreddits...")
+    print("-" * 70)
+    
+    posts = reddit_service.fetch_kenya_posts(
+        keywords=['government', 'policy', 'president', 'parliament'],
+        limit=10,
+        time_filter='week'
+    )
+    
+    print(f"✅ Fetched {len(posts)} Kenya posts\n")
+    
+    # Step 2: Analyze sentiment for all posts in one batch
+    print("\n🧠 Step 2: Analyzing sentiment...")
+    print("-" * 70)
+    
     # Combine title and content for analysis
-    text = f"{post['title']} {post['content']}"
+    texts = [' '.join((post['title'], post['content'])) for post in posts]
+    sentiments = sentiment_analyzer.analyze_batch(texts)
     
-    # Analyze sentiment
-    sentiment = sentiment_analyzer.analyze(text)
+    counts = Counter()
+    lines = []
     
-    # Display results
-    print(f"\n{i}. r/{post['subreddit']}: {post['title'][:50]}...")
-    print(f"   👤 By: u/{post['author']}")
-    print(f"   ⬆️  Score: {post['score']} | 💬 Comments: {post['num_comments']}")
-    print(f"   😊 Sentiment: {sentiment['sentiment'].upper()} ({sentiment['confidence']} confidence, {sentiment['score']:.2f})")
-    print(f"   🔗 {post['url']}")
-
-# Step 3: Calculate overall sentiment
-print("\n\n📊 Step 3: Overall Kenya Sentiment Analysis")
-print("-" * 70)
-
-sentiments = []
-for post in posts:
-    text = f"{post['title']} {post['content']}"
-    result = sentiment_analyzer.analyze(text)
-    sentiments.append(result['sentiment'])
-
-positive_count = sentiments.count('positive')
-negative_count = sentiments.count('negative')
-neutral_count = sentiments.count('neutral')
+    # Single pass: display the first 5, tally every post
+    for i, (post, sentiment) in enumerate(zip(posts, sentiments), 1):
+        counts[sentiment['sentiment']] += 1
+        
+        if i > 5:
+            continue
+        
+        # Display results (buffered, written once below)
+        lines.append(f"\n{i}. r/{post['subreddit']}: {post['title'][:50]}...")
+        lines.append(f"   👤 By: u/{post['author']}")
+        lines.append(f"   ⬆️  Score: {post['score']} | 💬 Comments: {post['num_comments']}")
+        lines.append(
+            f"   😊 Sentiment: {sentiment['sentiment'].upper()} "
+            f"({sentiment['confidence']} confidence, {sentiment['score']:.2f})"
+        )
+        lines.append(f"   🔗 {post['url']}")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
+    
+    # Step 3: Overall sentiment (tallied in the pass above)
+    print("\n\n📊 Step 3: Overall Kenya Sentiment Analysis")
+    print("-" * 70)
+    
+    positive_count = counts['positive']
+    negative_count = counts['negative']
+    neutral_count = counts['neutral']
+    
+    total = len(sentiments)
+    print(f"\n📈 Overall Sentiment Distribution:")
+    print(f"   ✅ Positive: {positive_count}/{total} ({positive_count/total*100:.1f}%)")
+    print(f"   ❌ Negative: {negative_count}/{total} ({negative_count/total*100:.1f}%)")
+    print(f"   ⚪ Neutral:  {neutral_count}/{total} ({neutral_count/total*100:.1f}%)")
+    
+    print("\n" + "=" * 70)
+    print("✅ Reddit sentiment analysis working!")
 
-total = len(sentiments)
-print(f"\n📈 Overall Sentiment Distribution:")
-print(f"   ✅ Positive: {positive_count}/{total} ({positive_count/total*100:.1f}%)")
-print(f"   ❌ Negative: {negative_count}/{total} ({negative_count/total*100:.1f}%)")
-print(f"   ⚪ Neutral:  {neutral_count}/{total} ({neutral_count/total*100:.1f}%)")
 
-print("\n" + "=" * 70)
-print("✅ Reddit sentiment analysis working!")
+if __name__ == "__main__":
+    test_reddit_sentiment()
@@ -1,53 +1,68 @@
 """
 Test all social media platforms
 """
-import sys
-sys.path.append('/Users/Mukira/gov-analysis-platform/backend')
+import asyncio
 
-print("🌍 Testing Social Media Platforms for Kenya")
-print("=" * 70)
 
-# Test 1: Telegram
-print("\n📱 Test 1: Telegram Public Channels")
-print("-" * 70)
-from app.services.social_media.telegram_service import telegram_service
+def test_social_platforms():
+    """Check Telegram, Mastodon and sentiment analysis"""
+    print("🌍 Testing Social Media Platforms for Kenya")
+    print("=" * 70)
+    
+    from app.services.social_media.telegram_service import telegram_service
+    from app.services.social_media.mastodon_service import mastodon_service
+    
+    async def fetch_all():
+        """Fetch Telegram and Mastodon posts concurrently (blocking clients, one thread each)"""
+        return await asyncio.gather(
+            asyncio.to_thread(telegram_service.get_channel_messages, 'kenyans_ke', limit=3),
+            asyncio.to_thread(mastodon_service.search_kenya_posts, "Kenya", limit=5),
+            return_exceptions=True
+        )
+    
+    telegram_posts, mastodon_posts = asyncio.run(fetch_all())
+    
+    # Test 1: Telegram
+    print("\n📱 Test 1: Telegram Public Channels")
+    print("-" * 70)
+    
+    if isinstance(telegram_posts, Exception):
+        print(f"❌ Telegram: {telegram_posts}")
+    else:
+        print(f"✅ Telegram: {len(telegram_posts)} posts fetched")
+        for post in telegram_posts[:2]:
+            print(f"   • {post['content'][:60]}...")
+    
+    # Test 2: Mastodon
+    print("\n🐘 Test 2: Mastodon/Fediverse")
+    print("-" * 70)
+    
+    if isinstance(mastodon_posts, Exception):
+        print(f"❌ Mastodon: {mastodon_posts}")
+    else:
+        print(f"✅ Mastodon: {len(mastodon_posts)} posts fetched")
+        for post in mastodon_posts[:2]:
+            print(f"   • @{post['username']}: {post['content'][:50]}...")
+    
+    # Test 3: Sentiment Analysis (CPU-bound, stays sync after the I/O gather)
+    print("\n🧠 Test 3: Sentiment Analysis")
+    print("-" * 70)
+    from app.services.social_media.sentiment_service import sentiment_analyzer
+    
+    test_texts = [
+        "Kenya's new agricultural policy is excellent for farmers!",
+        "The government budget cuts are disappointing.",
+        "Parliament met today to discuss the new bill."
+    ]
+    
+    for text in test_texts:
+        result = sentiment_analyzer.analyze(text)
+        print(f"   • \"{text[:40]}...\"")
+        print(f"     → {result['sentiment'].upper()} (polarity: {result['polarity']})")
+    
+    print("\n" + "=" * 70)
+    print("✅ Social media platform tests complete!")
 
-try:
-    telegram_posts = telegram_service.get_channel_messages('kenyans_ke', limit=3)
-    print(f"✅ Telegram: {len(telegram_posts)} posts fetched")
-    for post in telegram_posts[:2]:
-        print(f"   • {post['content'][:60]}...")
-except Exception as e:
-    print(f"❌ Telegram: {e}")
 
-# Test 2: Mastodon
-print("\n🐘 Test 2: Mastodon/Fediverse")
-print("-" * 70)
-from app.services.social_media.mastodon_service import mastodon_service
-
-try:
-    mastodon_posts = mastodon_service.search_kenya_posts("Kenya", limit=5)
-    print(f"✅ Mastodon: {len(mastodon_posts)} posts fetched")
-    for post in mastodon_posts[:2]:
-        print(f"   • @{post['username']}: {post['content'][:50]}...")
-except Exception as e:
-    print(f"❌ Mastodon: {e}")
-
-# Test 3: Sentiment Analysis
-print("\n🧠 Test 3: Sentiment Analysis")
-print("-" * 70)
-from app.services.social_media.sentiment_service import sentiment_analyzer
-
-test_texts = [
-    "Kenya's new agricultural policy is excellent for farmers!",
-    "The government budget cuts are disappointing.",
-    "Parliament met today to discuss the new bill."
-]
-
-for text in test_texts:
-    result = sentiment_analyzer.analyze(text)
-    print(f"   • \"{text[:40]}...\"")
-    print(f"     → {result['sentiment'].upper()} (polarity: {result['polarity']})")
-
-print("\n" + "=" * 70)
-print("✅ Social media platform tests complete!")
+if __name__ == "__main__":
+    test_social_platforms()
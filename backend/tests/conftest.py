@@ -0,0 +1,60 @@
+"""
+Shared fixtures for the GovGPT test suite
+Heavy service singletons are imported once per pytest session
+"""
+from contextlib import ExitStack
+from importlib.util import find_spec
+from unittest import mock
+import pytest
+
+# Network client constructors replaced for the whole session
+STUBBED_CLIENTS = [
+    'groq.Groq',
+    'qdrant_client.QdrantClient',
+    'googleapiclient.discovery.build',
+    'googleapiclient.discovery.build_from_document',
+]
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _stub_clients():
+    """
+    Replace external API clients with MagicMocks before any app module is imported
+
+    Tests import app modules inside the test body, so by the time they run
+    these constructors are already patched and no TCP/TLS setup happens.
+    Clients whose library isn't installed are left alone.
+    """
+    with ExitStack() as stack:
+        for target in STUBBED_CLIENTS:
+            if find_spec(target.split('.')[0]) is not None:
+                stack.enter_context(mock.patch(target, return_value=mock.MagicMock()))
+        yield
+
+
+@pytest.fixture(scope="session")
+def llm_service():
+    """LLM service singleton"""
+    from app.services.llm_service import llm_service
+    return llm_service
+
+
+@pytest.fixture(scope="session")
+def vector_service():
+    """Vector service singleton"""
+    from app.services.vector_service import vector_service
+    return vector_service
+
+
+@pytest.fixture(scope="session")
+def chat_service():
+    """Chat service singleton"""
+    from app.services.chat_service import chat_service
+    return chat_service
+
+
+@pytest.fixture(scope="session")
+def fastapi_app():
+    """Main FastAPI app"""
+    from app.main import app
+    return app
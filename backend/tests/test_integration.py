@@ -3,12 +3,16 @@ Integration Test Suite for GovGPT
 Tests imports, services, and API endpoints to catch issues early
 Run with: pytest backend/tests/test_integration.py -v
 """
-import pytest
+from pathlib import Path
+import itertools
+import subprocess
 import sys
-import os
 
-# Add backend to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import pytest
+
+from app.utils.query_classifier import classify_query, get_query_confidence
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
 
 
 class TestImports:
@@ -32,7 +36,6 @@ class TestImports:
         
     def test_utility_imports(self):
         """Test utility imports"""
-        from app.utils.query_classifier import classify_query, get_query_confidence
         assert classify_query is not None
         assert get_query_confidence is not None
     
@@ -40,6 +43,25 @@ class TestImports:
         """Test main FastAPI app imports"""
         from app.main import app
         assert app is not None
+    
+    def test_main_app_import_builds_no_service_clients(self):
+        """Importing the app leaves the lazy service singletons unconstructed"""
+        # Fresh interpreter: other tests and fixtures in this session build the singletons
+        script = (
+            "import app.main\n"
+            "from app.services import llm_service, vector_service\n"
+            "from app.services.social_media import youtube_service\n"
+            "print(llm_service._llm_service, vector_service._vector_service, "
+            "youtube_service._youtube_service)\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            cwd=BACKEND_DIR, capture_output=True, text=True
+        )
+        
+        assert result.returncode == 0, result.stderr
+        # Other services print status lines on import; the singletons are on the last line
+        assert result.stdout.strip().splitlines()[-1] == "None None None"
 
 
 class TestQueryClassifier:
@@ -47,8 +69,6 @@ class TestQueryClassifier:
     
     def test_decision_queries(self):
         """Test that decision queries are classified correctly"""
-        from app.utils.query_classifier import classify_query, get_query_confidence
-        
         decision_queries = [
             "Should Kenya expand universal healthcare?",
             "Should we allocate 10% to rural schools?",
@@ -58,17 +78,15 @@ class TestQueryClassifier:
         ]
         
         for query in decision_queries:
-            result = classify_query(query)
-            assert result == "decision", f"Query '{query}' should be classified as decision, got {result}"
-            
             detailed = get_query_confidence(query)
-            assert detailed['type'] == "decision"
+            assert detailed['type'] == "decision", (
+                f"Query '{query}' should be classified as decision, got {detailed['type']}"
+            )
             assert detailed['confidence'] >= 0.60, f"Decision query confidence too low: {detailed['confidence']}"
+            assert classify_query(query) == detailed['type']
     
     def test_exploratory_queries(self):
         """Test that exploratory queries are classified correctly"""
-        from app.utils.query_classifier import classify_query
-        
         exploratory_queries = [
             "What is universal healthcare?",
             "Explain the history of education in Kenya",
@@ -85,9 +103,8 @@ class TestQueryClassifier:
 class TestLLMService:
     """Test LLM service functionality"""
     
-    def test_llm_service_exists(self):
+    def test_llm_service_exists(self, llm_service):
         """Test LLM service is initialized"""
-        from app.services.llm_service import llm_service
         assert llm_service is not None
         assert llm_service.model == "llama-3.3-70b-versatile"
     
@@ -99,10 +116,8 @@ class TestLLMService:
         assert "decision" in DECISION_REPORT_SYSTEM_PROMPT.lower()
         assert "markdown" in SYSTEM_PROMPT.lower()
     
-    def test_create_prompt_method(self):
+    def test_create_prompt_method(self, llm_service):
         """Test prompt creation method"""
-        from app.services.llm_service import llm_service
-        
         prompt = llm_service.create_prompt(
             question="Test question?",
             context_chunks=[{"filename": "test.pdf", "text": "Test content"}],
@@ -116,28 +131,26 @@ class TestLLMService:
 class TestChatService:
     """Test chat service orchestration"""
     
-    def test_chat_service_exists(self):
+    def test_chat_service_exists(self, chat_service):
         """Test chat service is initialized"""
-        from app.services.chat_service import chat_service
         assert chat_service is not None
     
-    def test_extract_keywords(self):
+    def test_extract_keywords(self, chat_service):
         """Test keyword extraction"""
-        from app.services.chat_service import chat_service
-        
         keywords = chat_service._extract_keywords("What is the impact of healthcare policy?")
         assert len(keywords) > 0
         assert 'kenya' in [k.lower() for k in keywords]  # Always includes Kenya
     
-    def test_stream_message_structure(self):
+    def test_stream_message_structure(self, chat_service):
         """Test that stream_message yields proper structure"""
-        from app.services.chat_service import chat_service
-        
         # Test the generator structure (without actually calling LLM)
         stream = chat_service.stream_message("test question", include_news=False, include_sentiment=False)
         
-        # Should yield at least classification and context
-        results = list(stream)[:2]  # Get first 2 items
+        # Should yield at least classification and context; stop after those two
+        try:
+            results = list(itertools.islice(stream, 2))
+        finally:
+            stream.close()  # release the generator (and any LLM stream) early
         
         assert len(results) >= 1
         assert 'type' in results[0]
@@ -151,15 +164,13 @@ class TestAPIEndpoints:
         """Test chat API endpoints are defined"""
         from app.api.chat import router
         
-        routes = [route.path for route in router.routes]
+        routes = frozenset(route.path for route in router.routes)
         assert '/stream' in routes
         assert '/generate-report' in routes
     
-    def test_main_app_routes(self):
+    def test_main_app_routes(self, fastapi_app):
         """Test main app has all required routes"""
-        from app.main import app
-        
-        routes = [route.path for route in app.routes]
+        routes = frozenset(route.path for route in fastapi_app.routes)
         assert '/api/chat/stream' in routes
         assert '/api/chat/generate-report' in routes
         assert '/health' in routes
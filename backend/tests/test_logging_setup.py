@@ -0,0 +1,29 @@
+"""
+Tests for queue-based logging setup
+"""
+import logging
+
+
+class TestLoggingSetup:
+    """Test setup/shutdown of the root QueueHandler"""
+    
+    def test_shutdown_detaches_queue_handler(self):
+        """Repeated setup/shutdown cycles leave the root handlers unchanged"""
+        from app.utils import logging_setup
+        
+        root = logging.getLogger()
+        level = logging.getLevelName(root.level)
+        was_active = logging_setup._listener is not None
+        logging_setup.shutdown_logging()
+        handlers = list(root.handlers)
+        
+        try:
+            for _ in range(2):
+                logging_setup.setup_logging("INFO")
+                assert len(root.handlers) == len(handlers) + 1
+                logging_setup.shutdown_logging()
+                assert root.handlers == handlers
+        finally:
+            root.setLevel(level)
+            if was_active:
+                logging_setup.setup_logging(level)
@@ -0,0 +1,29 @@
+"""
+Tests for Telegram web preview parsing
+"""
+
+
+class TestParseTelegramWeb:
+    """Test message extraction from the t.me/s/<channel> page"""
+    
+    def test_non_ascii_without_meta_charset(self):
+        """UTF-8 text survives parsing when the page declares no charset"""
+        from app.services.social_media.telegram_service import TelegramService
+        
+        text = "Rais Ruto — bajeti 🇰🇪 café"
+        html = (
+            '<html><body>'
+            '<div class="tgme_widget_message_bubble">'
+            f'<div class="tgme_widget_message_text">{text}</div>'
+            '<time class="datetime" datetime="2024-06-13T09:00:00+00:00"></time>'
+            '<span class="tgme_widget_message_views">1.2K</span>'
+            '</div>'
+            '</body></html>'
+        )
+        
+        messages = TelegramService()._parse_telegram_web(html, 'kenyans_ke', limit=5)
+        
+        assert len(messages) == 1
+        assert messages[0]['content'] == text
+        assert messages[0]['published_at'] == "2024-06-13T09:00:00+00:00"
+        assert messages[0]['views'] == 1200
@@ -0,0 +1,63 @@
+"""
+Tests for YouTube comment sentiment aggregation
+YouTube calls are stubbed; sentiment scoring runs for real
+"""
+from unittest import mock
+
+
+def _comment(video_id: str, content: str) -> dict:
+    """Comment in the shape YouTubeService._standardize_comment emits"""
+    return {'comment_id': f"{video_id}-{len(content)}", 'video_id': video_id, 'content': content}
+
+
+class TestGetSentimentFromVideos:
+    """Test the fused filter/score/tally pass"""
+    
+    def test_counts_average_and_top_comments(self):
+        """Counts, average score and top-10 list come from the 'content' field"""
+        from app.services.social_media.youtube_comment_sentiment import YouTubeCommentSentiment
+        from app.services.social_media.sentiment_service import sentiment_analyzer
+        
+        videos = [
+            {'video_id': 'v1', 'title': 'Budget debate'},
+            {'video_id': 'v2', 'title': 'Healthcare reform'},
+        ]
+        positive = [f"This policy is excellent and great for everyone {i}" for i in range(6)]
+        negative = [f"The budget cuts are terrible and awful news {i}" for i in range(5)]
+        neutral = ["Parliament met on Tuesday afternoon"]
+        comments = [
+            [_comment('v1', text) for text in positive] + [_comment('v1', "too short")],
+            [_comment('v2', text) for text in negative + neutral],
+        ]
+        
+        youtube = mock.MagicMock()
+        youtube.search_kenya_videos.return_value = videos
+        youtube.get_comments_for_videos.return_value = comments
+        
+        service = YouTubeCommentSentiment()
+        service.youtube = youtube
+        result = service.get_sentiment_from_videos(
+            "Kenya budget", max_videos=2, comments_per_video=20
+        )
+        
+        youtube.search_kenya_videos.assert_called_once_with("Kenya budget", max_results=2)
+        youtube.get_comments_for_videos.assert_called_once_with(['v1', 'v2'], max_per_video=20)
+        
+        # The comment under 10 characters is dropped
+        kept = positive + negative + neutral
+        assert result['total_comments'] == len(kept)
+        assert result['videos_analyzed'] == 2
+        
+        assert result['sentiment_summary'] == {'positive': 6, 'negative': 5, 'neutral': 1}
+        
+        expected = [sentiment_analyzer.analyze(text) for text in kept]
+        
+        average = sum(s['score'] for s in expected) / len(expected)
+        assert result['average_score'] == round(average, 3)
+        
+        # Top 10 are the most polarized, strongest first; the neutral comment never makes it
+        top = result['sample_comments']
+        strongest = sorted((s['score'] for s in expected), reverse=True)[:10]
+        assert [c['sentiment_score'] for c in top] == strongest
+        assert neutral[0] not in {c['content'] for c in top}
+        assert {c['video_title'] for c in top} <= {'Budget debate', 'Healthcare reform'}
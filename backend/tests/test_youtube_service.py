@@ -0,0 +1,156 @@
+"""
+Tests for YouTube response caching and the quota sentinel
+API clients are stubbed; responses go through a throwaway disk cache
+"""
+from unittest import mock
+import asyncio
+
+import pytest
+
+QUOTA_BODY = b'{"error": {"code": 403, "errors": [{"reason": "quotaExceeded"}]}}'
+SEARCH_BODY = {
+    'items': [
+        {
+            'id': {'videoId': 'abc123'},
+            'snippet': {'title': 'Budget debate', 'channelTitle': 'Citizen TV'}
+        }
+    ]
+}
+
+
+@pytest.fixture
+def youtube(tmp_path):
+    """YouTube service module with its response cache in a temp directory"""
+    import diskcache
+    from app.services.social_media import youtube_service
+    
+    cache = diskcache.Cache(str(tmp_path))
+    cache.create_tag_index()
+    with mock.patch.object(youtube_service, '_response_cache', return_value=cache):
+        yield youtube_service
+    cache.close()
+
+
+def _rest_client(module, handler):
+    """AsyncClient that routes every request to handler instead of the network"""
+    import httpx
+    return httpx.AsyncClient(
+        base_url=module.YOUTUBE_API_URL,
+        transport=httpx.MockTransport(handler)
+    )
+
+
+class TestQuotaReset:
+    """Test the quota sentinel lifetime"""
+    
+    def test_ttl_spans_the_short_dst_day(self, youtube):
+        """On spring-forward day, 00:30 Pacific is 22.5 real hours from the next midnight"""
+        from datetime import datetime
+        from zoneinfo import ZoneInfo
+        
+        frozen = datetime(2024, 3, 10, 0, 30, tzinfo=ZoneInfo(youtube.QUOTA_RESET_TZ))
+        
+        class FrozenDatetime(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return frozen.astimezone(tz)
+        
+        with mock.patch.object(youtube, 'datetime', FrozenDatetime):
+            assert youtube._seconds_until_quota_reset() == int(22.5 * 3600)
+
+
+class TestAsyncSearchCache:
+    """Test the REST path (_get_json)"""
+    
+    def test_repeat_search_is_served_from_cache(self, youtube):
+        """The second identical search never reaches the API"""
+        import httpx
+        
+        requests_seen = []
+        
+        def handler(request):
+            requests_seen.append(request)
+            return httpx.Response(200, json=SEARCH_BODY)
+        
+        async def run():
+            async with _rest_client(youtube, handler) as client:
+                first = await service.search_kenya_videos_async("Kenya budget", client=client)
+                second = await service.search_kenya_videos_async("Kenya budget", client=client)
+            return first, second
+        
+        service = youtube.YouTubeService(api_key="test-key")
+        first, second = asyncio.run(run())
+        
+        assert len(requests_seen) == 1
+        assert first == second
+        assert first[0]['video_id'] == 'abc123'
+    
+    def test_quota_exceeded_short_circuits_later_calls(self, youtube):
+        """A 403 quotaExceeded sets the sentinel; later searches skip the API"""
+        import httpx
+        
+        requests_seen = []
+        
+        def handler(request):
+            requests_seen.append(request)
+            return httpx.Response(403, content=QUOTA_BODY)
+        
+        async def run():
+            async with _rest_client(youtube, handler) as client:
+                first = await service.search_kenya_videos_async("Kenya budget", client=client)
+                second = await service.search_kenya_videos_async("Kenya health", client=client)
+            return first, second
+        
+        service = youtube.YouTubeService(api_key="test-key")
+        first, second = asyncio.run(run())
+        
+        assert first == [] and second == []
+        assert len(requests_seen) == 1
+        assert youtube._response_cache().get(youtube.QUOTA_EXCEEDED_KEY) is True
+
+
+class TestCommentBatch:
+    """Test the batched comment fetch"""
+    
+    def test_no_api_key_returns_empty_lists(self, youtube):
+        """Without a key, every video gets an empty comment list and no client is opened"""
+        service = youtube.YouTubeService()
+        
+        with mock.patch.object(service, '_rest_client') as rest_client:
+            assert service.get_comments_for_videos(['a', 'b']) == [[], []]
+        
+        rest_client.assert_not_called()
+
+
+class TestSyncSearchCache:
+    """Test the googleapiclient path (_cached_execute)"""
+    
+    def test_repeat_search_is_served_from_cache(self, youtube):
+        """The second identical search never executes a request"""
+        service = youtube.YouTubeService()
+        service.youtube = mock.MagicMock()
+        execute = service.youtube.search.return_value.list.return_value.execute
+        execute.return_value = SEARCH_BODY
+        
+        first = service.search_kenya_videos("Kenya budget")
+        second = service.search_kenya_videos("Kenya budget")
+        
+        assert execute.call_count == 1
+        assert first == second
+        assert first[0]['video_id'] == 'abc123'
+    
+    def test_quota_exceeded_short_circuits_later_calls(self, youtube):
+        """A 403 quotaExceeded is not retried and blocks later requests"""
+        import httplib2
+        from googleapiclient.errors import HttpError
+        
+        service = youtube.YouTubeService()
+        service.youtube = mock.MagicMock()
+        execute = service.youtube.search.return_value.list.return_value.execute
+        execute.side_effect = HttpError(httplib2.Response({'status': 403}), QUOTA_BODY)
+        
+        assert service.search_kenya_videos("Kenya budget") == []
+        assert service.search_kenya_videos("Kenya health") == []
+        
+        assert execute.call_count == 1
+        assert youtube._response_cache().get(youtube.QUOTA_EXCEEDED_KEY) is True